@@ -15,11 +15,13 @@ Usage:
 """
 
 import csv
+import functools
 import re
 import sys
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 
 def extract_frontmatter_from_source(source_path: str) -> Dict:
@@ -65,10 +67,22 @@ LANG_MAPPINGS = {
     'text': 'text',
 }
 
+# Canonical names _normalize_lang maps to (and leaves unchanged)
+_CANONICAL_LANGS = frozenset(LANG_MAPPINGS.values())
+
 
 def _normalize_lang(lang: str) -> str:
     """Map a language identifier to a canonical name for syntaxhighlight."""
-    return LANG_MAPPINGS.get(lang.lower().strip(), lang.lower().strip() or 'text')
+    key = lang.lower().strip()
+    return LANG_MAPPINGS.get(key) or key or 'text'
+
+
+_RE_CODE_PROMPT = re.compile(r'^[\$#>]')
+_RE_CODE_IMPORT = re.compile(r'^(import |from |use |require |include )')
+_RE_CODE_TRAILING_PUNCT = re.compile(r'[{};=\[\]()]\s*$')
+_RE_CODE_COMMAND = re.compile(r'^(docker|git|curl|npm|pip|apt|sudo|cd |mkdir|cp |mv |rm |ls |cat |php |python)')
+_RE_CODE_JSON_KEY = re.compile(r'^\s*"[\w]+":\s')
+_RE_CODE_ENV_ASSIGN = re.compile(r'^[\w_]+=')
 
 
 def _looks_like_code(text: str) -> bool:
@@ -80,21 +94,27 @@ def _looks_like_code(text: str) -> bool:
     for line in lines:
         stripped = line.strip()
         # Shell commands, variable assignments, braces, imports, etc.
-        if re.match(r'^[\$#>]', stripped):
+        if _RE_CODE_PROMPT.match(stripped):
             code_indicators += 1
-        elif re.match(r'^(import |from |use |require |include )', stripped):
+        elif _RE_CODE_IMPORT.match(stripped):
             code_indicators += 1
-        elif re.search(r'[{};=\[\]()]\s*$', stripped):
+        elif _RE_CODE_TRAILING_PUNCT.search(stripped):
             code_indicators += 1
-        elif re.match(r'^(docker|git|curl|npm|pip|apt|sudo|cd |mkdir|cp |mv |rm |ls |cat |php |python)', stripped):
+        elif _RE_CODE_COMMAND.match(stripped):
             code_indicators += 1
-        elif re.match(r'^\s*"[\w]+":\s', stripped):  # JSON-like
+        elif _RE_CODE_JSON_KEY.match(stripped):  # JSON-like
             code_indicators += 1
-        elif re.match(r'^[\w_]+=', stripped):  # env var assignment
+        elif _RE_CODE_ENV_ASSIGN.match(stripped):  # env var assignment
             code_indicators += 1
     return code_indicators >= max(1, len(lines) * 0.3)
 
 
+_RE_FENCED_IN_PRE = re.compile(r'<pre>```(\w*)\n(.*?)\n```</pre>', re.DOTALL)
+_RE_BARE_FENCED = re.compile(r'^```(\w*)\n(.*?)\n```$', re.DOTALL | re.MULTILINE)
+_RE_PRE_BLOCK = re.compile(r'<pre>(.*?)</pre>', re.DOTALL)
+_RE_SH_LANG = re.compile(r'<syntaxhighlight lang="([^"]*?)">')
+
+
 def fix_code_blocks(content: str) -> str:
     """
     Fix code block syntax highlighting.
@@ -111,12 +131,7 @@ def fix_code_blocks(content: str) -> str:
         lang = _normalize_lang(lang)
         return f'<syntaxhighlight lang="{lang}">\n{code}\n</syntaxhighlight>'
 
-    content = re.sub(
-        r'<pre>```(\w*)\n(.*?)\n```</pre>',
-        replace_fenced_in_pre,
-        content,
-        flags=re.DOTALL
-    )
+    content = _RE_FENCED_IN_PRE.sub(replace_fenced_in_pre, content)
 
     # Pattern 2: standalone ``` blocks that Pandoc left as-is (not in <pre>)
     def replace_bare_fenced(match):
@@ -125,12 +140,7 @@ def fix_code_blocks(content: str) -> str:
         lang = _normalize_lang(lang)
         return f'<syntaxhighlight lang="{lang}">\n{code}\n</syntaxhighlight>'
 
-    content = re.sub(
-        r'^```(\w*)\n(.*?)\n```$',
-        replace_bare_fenced,
-        content,
-        flags=re.DOTALL | re.MULTILINE
-    )
+    content = _RE_BARE_FENCED.sub(replace_bare_fenced, content)
 
     # Pattern 3: <pre> blocks that contain code (heuristic conversion)
     # Only convert if the content looks like code, not prose
@@ -144,53 +154,129 @@ def fix_code_blocks(content: str) -> str:
             return f'<syntaxhighlight lang="{lang}">\n{inner.strip()}\n</syntaxhighlight>'
         return match.group(0)
 
-    content = re.sub(
-        r'<pre>(.*?)</pre>',
-        replace_pre_code,
-        content,
-        flags=re.DOTALL
-    )
+    content = _RE_PRE_BLOCK.sub(replace_pre_code, content)
 
     # Pattern 4: normalize existing syntaxhighlight lang attributes
     def normalize_sh_lang(match):
+        if match.group(1) in _CANONICAL_LANGS:
+            return match.group(0)  # Already canonical
         lang = _normalize_lang(match.group(1))
         return f'<syntaxhighlight lang="{lang}">'
 
-    content = re.sub(
-        r'<syntaxhighlight lang="([^"]*?)">',
-        normalize_sh_lang,
-        content
-    )
+    content = _RE_SH_LANG.sub(normalize_sh_lang, content)
 
     return content
 
 
+# The language is always evident from the start of a block, so _guess_lang
+# only scans this many leading characters.
+_GUESS_SAMPLE_CHARS = 2048
+
+_RE_PHP_VAR = re.compile(r'\$\w+\s*=\s*\$')
+_RE_JSON_START = re.compile(r'\s*[\[{]')
+_RE_JSON_KEY = re.compile(r'["\']\w+["\']\s*:')
+_RE_SQL_START = re.compile(r'\s*(SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|SET GLOBAL|mysql>)', re.IGNORECASE)
+_RE_SHELL_PROMPT = re.compile(r'\s*[\$#>]')
+_RE_SHELL_CMD = re.compile(r'\s*(docker|git|curl|npm|sudo|apt|pip|cd |ssh )')
+_RE_YAML_KEY = re.compile(r'\w+:\s')
+_RE_ENV_VAR = re.compile(r'^[A-Z_]+=')
+
+
 def _guess_lang(code: str) -> str:
     """Try to guess the language of a code block from its content."""
-    first_line = code.strip().splitlines()[0] if code.strip() else ''
+    return _guess_lang_sample(code[:_GUESS_SAMPLE_CHARS])
+
+
+@functools.lru_cache(maxsize=512)
+def _guess_lang_sample(sample: str) -> str:
+    # Cached: docs reuse near-identical snippets across pages
+    first_line = sample.strip().splitlines()[0] if sample.strip() else ''
 
     # PHP
-    if '<?php' in code or re.search(r'\$\w+\s*=\s*\$', code):
+    if '<?php' in sample or _RE_PHP_VAR.search(sample):
         return 'php'
     # JSON
-    if re.match(r'\s*[\[{]', code) and re.search(r'["\']\w+["\']\s*:', code):
+    if _RE_JSON_START.match(sample) and _RE_JSON_KEY.search(sample):
         return 'json'
     # SQL
-    if re.match(r'\s*(SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|SET GLOBAL|mysql>)', code, re.IGNORECASE):
+    if _RE_SQL_START.match(sample):
         return 'sql'
     # Shell commands
-    if re.match(r'\s*[\$#>]', first_line) or re.match(r'\s*(docker|git|curl|npm|sudo|apt|pip|cd |ssh )', first_line):
+    if _RE_SHELL_PROMPT.match(first_line) or _RE_SHELL_CMD.match(first_line):
         return 'bash'
     # YAML/config
-    if re.match(r'\w+:\s', first_line):
+    if _RE_YAML_KEY.match(first_line):
         return 'yaml'
     # Env vars
-    if re.match(r'^[A-Z_]+=', first_line):
+    if _RE_ENV_VAR.match(first_line):
         return 'bash'
 
     return 'text'
 
 
+# Source-tree prefixes stripped to get the relative doc path
+DOC_PREFIXES = ('df-docs/df-docs/docs/', 'guide/dreamfactory-book-v2/content/en/docs/')
+
+
+# Cheap string equivalents of Path(...).name/.stem/.parent for the per-link and
+# per-row hot loops (avoids building a PurePath for every lookup).
+def _basename(p: str) -> str:
+    return p.rstrip('/').rsplit('/', 1)[-1]
+
+
+def _stem(p: str) -> str:
+    name = _basename(p)
+    return name.rsplit('.', 1)[0] or name
+
+
+def _dirname(p: str) -> str:
+    return p.rsplit('/', 1)[0] if '/' in p else ''
+
+
+def _rel_doc_path(inv_src: str) -> str:
+    """Extract the relative doc path from an inventory source_path."""
+    for pfx in DOC_PREFIXES:
+        if inv_src.startswith(pfx):
+            return inv_src[len(pfx):]
+    return inv_src
+
+
+_RE_MD_EXT = re.compile(r'\.md$')
+
+INVENTORY_COLUMNS = ('source_path', 'target_wiki_page', 'title', 'keywords', 'status')
+
+
+class InventoryRow(NamedTuple):
+    source_path: str
+    target_wiki_page: str
+    title: str
+    keywords: str
+    status: str
+    rel_dir: str  # directory relative to the docs root, precomputed for sibling lookups
+
+
+def _read_inventory(inv_path: Path) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield (source_path, target_wiki_page, title, keywords, status) per inventory row.
+
+    Uses csv.reader with precomputed column indices instead of DictReader so no
+    per-row dict is allocated. Missing columns and short rows read as ''.
+    """
+    with open(inv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        width = len(header)
+        # Missing columns point at a padding cell past the end of the row
+        pick = itemgetter(*(header.index(name) if name in header else width
+                            for name in INVENTORY_COLUMNS))
+        for row in reader:
+            if not row:
+                continue
+            if len(row) <= width:
+                row += [''] * (width + 1 - len(row))
+            yield pick(row)
+
+
 def _load_link_mapping(inventory_path: Optional[str] = None) -> Dict[str, str]:
     """
     Build a mapping from source file paths (and their slug variants) to wiki page titles
@@ -205,34 +291,29 @@ def _load_link_mapping(inventory_path: Optional[str] = None) -> Dict[str, str]:
     if not inv_path.exists():
         return mapping
 
-    with open(inv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            source = row.get('source_path', '')
-            target = row.get('target_wiki_page', '')
-            if not source or not target:
-                continue
-
-            # Strip prefix directories to get the relative doc path
-            # df-docs/df-docs/docs/getting-started/.../docker-installation.md
-            # -> getting-started/.../docker-installation
-            for prefix in ['df-docs/df-docs/docs/', 'guide/dreamfactory-book-v2/content/en/docs/']:
-                if source.startswith(prefix):
-                    source = source[len(prefix):]
-                    break
-
-            # Remove .md extension
-            source_no_ext = re.sub(r'\.md$', '', source)
-
-            # Store multiple lookup keys for the same target:
-            # 1. Full relative path: getting-started/installing-dreamfactory/docker-installation
-            mapping[source_no_ext.lower()] = target
-            # 2. Just the filename slug: docker-installation
-            slug = Path(source_no_ext).stem
-            if slug and slug != '_index' and slug not in mapping:
-                mapping[slug.lower()] = target
-            # 3. With /docs/ prefix (some links use absolute paths)
-            mapping[('docs/' + source_no_ext).lower()] = target
+    for source, target, _title, _keywords, _status in _read_inventory(inv_path):
+        if not source or not target:
+            continue
+
+        # Strip prefix directories to get the relative doc path
+        # df-docs/df-docs/docs/getting-started/.../docker-installation.md
+        # -> getting-started/.../docker-installation
+        source = _rel_doc_path(source)
+
+        # Remove .md extension
+        source_no_ext = _RE_MD_EXT.sub('', source)
+
+        # Store multiple lookup keys for the same target:
+        # 1. Full relative path: getting-started/installing-dreamfactory/docker-installation
+        mapping[source_no_ext.lower()] = target
+        # 2. Just the filename slug: docker-installation
+        slug = _stem(source_no_ext)
+        if slug and slug != '_index' and slug not in mapping:
+            mapping[slug.lower()] = target
+        # 3. With /docs/ prefix (some links use absolute paths). Any key that
+        #    would match 'docs/' + <key> also matches key 1, so lookups only
+        #    need the full path and the slug.
+        mapping[('docs/' + source_no_ext).lower()] = target
 
     return mapping
 
@@ -248,6 +329,11 @@ def _get_link_map() -> Dict[str, str]:
     return _LINK_MAP
 
 
+_RE_MD_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_WIKI_LINK = re.compile(r'\[\[([^\]|]+)(\|[^\]]*\]\]|\]\])')
+_RE_NAMESPACE_PREFIX = re.compile(r'^[A-Z][a-z0-9]+:')
+
+
 def convert_internal_links(content: str, source_path: Optional[str] = None) -> str:
     """
     Convert internal markdown links to MediaWiki links.
@@ -276,13 +362,11 @@ def convert_internal_links(content: str, source_path: Optional[str] = None) -> s
 
         # Internal links - try inventory mapping first
         path = url.lstrip('/')
-        path = re.sub(r'\.md$', '', path)
+        path = _RE_MD_EXT.sub('', path)
         path_lower = path.lower()
 
-        # Try various lookup keys
-        wiki_page = (link_map.get(path_lower) or
-                     link_map.get(Path(path_lower).stem) or
-                     link_map.get('docs/' + path_lower))
+        # Full path (the map also holds the docs/-prefixed form), then slug
+        wiki_page = link_map.get(path_lower) or link_map.get(_stem(path_lower))
 
         if not wiki_page:
             # Fallback: convert path to wiki page format
@@ -295,7 +379,7 @@ def convert_internal_links(content: str, source_path: Optional[str] = None) -> s
         return f'[[{wiki_page}{anchor_part}|{text}]]'
 
     # Match markdown links: [text](url)
-    content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', replace_link, content)
+    content = _RE_MD_LINK.sub(replace_link, content)
 
     # Also fix wiki-style internal links that Pandoc already converted
     # [[source/path/page|text]] -> [[Wiki_Page_Title|text]]
@@ -308,7 +392,7 @@ def convert_internal_links(content: str, source_path: Optional[str] = None) -> s
         if target.startswith(('File:', 'Category:', '#', 'http', 'Template:')):
             return match.group(0)
         # Don't touch if it has a namespace prefix like V2: or Legacy:
-        if re.match(r'^[A-Z][a-z0-9]+:', target):
+        if _RE_NAMESPACE_PREFIX.match(target):
             return match.group(0)
 
         # Split off anchor
@@ -319,23 +403,25 @@ def convert_internal_links(content: str, source_path: Optional[str] = None) -> s
 
         target_lower = target.lower().strip('/')
         # Try inventory mapping
-        wiki_page = (link_map.get(target_lower) or
-                     link_map.get(Path(target_lower).stem) or
-                     link_map.get('docs/' + target_lower))
+        wiki_page = link_map.get(target_lower) or link_map.get(_stem(target_lower))
 
         if wiki_page:
             return f'[[{wiki_page}{anchor_part}{rest}'
         return match.group(0)
 
-    content = re.sub(
-        r'\[\[([^\]|]+)(\|[^\]]*\]\]|\]\])',
-        fix_wiki_link,
-        content
-    )
+    content = _RE_WIKI_LINK.sub(fix_wiki_link, content)
 
     return content
 
 
+_RE_MD_IMAGE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+_RE_WIKI_IMAGE = re.compile(r'\[\[File:([^\]|]+)\|?([^\]]*)\]\]')
+_RE_HTML_IMAGE = re.compile(r'<img\s+(.*?)/?>', re.DOTALL)
+_RE_IMG_SRC = re.compile(r'src="([^"]+)"')
+_RE_IMG_ALT = re.compile(r'alt="([^"]+)"')
+_RE_P_WRAPPED_IMAGE = re.compile(r'<p>\s*(\[\[File:.*?\]\])\s*</p>')
+
+
 def fix_image_references(content: str) -> str:
     """
     Fix image references for MediaWiki.
@@ -346,16 +432,12 @@ def fix_image_references(content: str) -> str:
     def replace_md_image(match):
         alt = match.group(1) or ''
         img_path = match.group(2)
-        filename = Path(img_path).name
+        filename = _basename(img_path)
         if alt:
             return f'[[File:{filename}|thumb|{alt}]]'
         return f'[[File:{filename}|thumb]]'
 
-    content = re.sub(
-        r'!\[([^\]]*)\]\(([^)]+)\)',
-        replace_md_image,
-        content
-    )
+    content = _RE_MD_IMAGE.sub(replace_md_image, content)
 
     # Pattern 2: Pandoc's wiki-style image output with full paths
     # [[File:/img/docker-install/image.png|alt]] -> [[File:image.png|thumb|alt]]
@@ -363,7 +445,7 @@ def fix_image_references(content: str) -> str:
         full_path = match.group(1)
         rest = match.group(2) if match.group(2) else ''
 
-        filename = Path(full_path).name
+        filename = _basename(full_path)
 
         # Parse existing options
         parts = [p.strip() for p in rest.split('|') if p.strip()] if rest else []
@@ -374,39 +456,72 @@ def fix_image_references(content: str) -> str:
 
         return f'[[File:{filename}|{"|".join(parts)}]]' if parts else f'[[File:{filename}|thumb]]'
 
-    content = re.sub(
-        r'\[\[File:([^\]|]+)\|?([^\]]*)\]\]',
-        fix_wiki_image,
-        content
-    )
+    content = _RE_WIKI_IMAGE.sub(fix_wiki_image, content)
 
     # Pattern 3: Hugo-style HTML images
     # <img src="/images/salesforce/foo.png" width="600" alt="Description">
     def replace_html_image(match):
         attrs = match.group(1)
-        src_match = re.search(r'src="([^"]+)"', attrs)
-        alt_match = re.search(r'alt="([^"]+)"', attrs)
+        src_match = _RE_IMG_SRC.search(attrs)
+        alt_match = _RE_IMG_ALT.search(attrs)
         if not src_match:
             return match.group(0)
-        filename = Path(src_match.group(1)).name
+        filename = _basename(src_match.group(1))
         alt = alt_match.group(1) if alt_match else ''
         if alt:
             return f'[[File:{filename}|thumb|{alt}]]'
         return f'[[File:{filename}|thumb]]'
 
-    content = re.sub(
-        r'<img\s+(.*?)/?>',
-        replace_html_image,
-        content,
-        flags=re.DOTALL
-    )
+    content = _RE_HTML_IMAGE.sub(replace_html_image, content)
 
     # Clean up: remove <p> tags that wrapped images (from Hugo)
-    content = re.sub(r'<p>\s*(\[\[File:.*?\]\])\s*</p>', r'\1', content)
+    content = _RE_P_WRAPPED_IMAGE.sub(r'\1', content)
 
     return content
 
 
+ADMONITION_TYPES = {
+    'note': 'Note',
+    'warning': 'Warning',
+    'tip': 'Tip',
+    'info': 'Note',
+    'caution': 'Warning',
+    'danger': 'Warning',
+    'success': 'Tip',
+}
+
+# Pattern 1: Docusaurus admonitions wrapped in <pre> by Pandoc
+# <pre>:::type Title\ncontent\n::::</pre>  (:::: is how Pandoc renders the closing :::)
+_ADMONITION_PRE_PATTERNS = [
+    (re.compile(rf'<pre>\s*:::{admon_type}(?:\[([^\]]*)\]|\s+([^\n]*?))?\s*\n(.*?)\s*::::?\s*</pre>',
+                re.DOTALL | re.IGNORECASE), template)
+    for admon_type, template in ADMONITION_TYPES.items()
+]
+# Pattern 2: Bare Docusaurus admonitions (not wrapped in <pre>)
+_ADMONITION_BARE_PATTERNS = [
+    (re.compile(rf':::{admon_type}(?:\[([^\]]*)\]|\s+([^\n]*?))?\s*\n(.*?)\s*:::(?!:)',
+                re.DOTALL | re.IGNORECASE), template)
+    for admon_type, template in ADMONITION_TYPES.items()
+]
+_RE_HUGO_ALERT = re.compile(
+    r'\{\{[<%]\s*alert\s+(.*?)\s*[>%]\}\}(.*?)\{\{[<%]\s*/alert\s*[>%]\}\}', re.DOTALL)
+_RE_HUGO_ALERT_ESCAPED = re.compile(
+    r'\{\{&lt;\s*alert\s+(.*?)\s*&gt;\}\}(.*?)\{\{&lt;\s*/alert\s*&gt;\}\}', re.DOTALL)
+_RE_ALERT_COLOR = re.compile(r'color=["\u201c](\w+)["\u201d]')
+
+
+def _make_admonition_replacer(template_name: str):
+    def replacer(match):
+        bracket_title = match.group(1)  # from :::type[Title]
+        space_title = match.group(2)     # from :::type Title
+        body = match.group(3).strip()
+        title = (bracket_title or space_title or '').strip()
+        if title:
+            return f'{{{{{template_name}|title={title}|{body}}}}}'
+        return f'{{{{{template_name}|{body}}}}}'
+    return replacer
+
+
 def convert_admonitions(content: str) -> str:
     """
     Convert Docusaurus admonitions and Hugo alert shortcodes to MediaWiki templates.
@@ -416,52 +531,17 @@ def convert_admonitions(content: str) -> str:
     - <pre>:::caution ...\n::::</pre>  (Docusaurus, wrapped in <pre> by Pandoc)
     - {{< alert color="warning" >}} ... {{< /alert >}}  (Hugo)
     """
-    admonition_types = {
-        'note': 'Note',
-        'warning': 'Warning',
-        'tip': 'Tip',
-        'info': 'Note',
-        'caution': 'Warning',
-        'danger': 'Warning',
-        'success': 'Tip',
-    }
-
     # Pattern 1: Docusaurus admonitions wrapped in <pre> by Pandoc
-    # <pre>:::type Title\ncontent\n::::</pre>  (:::: is how Pandoc renders the closing :::)
     # Handles: :::tip Pro Tip (space-separated title)
     #          :::info[CLI Methods] (bracket-enclosed title)
-    for admon_type, template in admonition_types.items():
-        pattern = rf'<pre>\s*:::{admon_type}(?:\[([^\]]*)\]|\s+([^\n]*?))?\s*\n(.*?)\s*::::?\s*</pre>'
-        def make_replacement(template_name):
-            def replacer(match):
-                bracket_title = match.group(1)  # from :::type[Title]
-                space_title = match.group(2)     # from :::type Title
-                body = match.group(3).strip()
-                title = (bracket_title or space_title or '').strip()
-                if title:
-                    return f'{{{{{template_name}|title={title}|{body}}}}}'
-                return f'{{{{{template_name}|{body}}}}}'
-            return replacer
-        content = re.sub(pattern, make_replacement(template), content,
-                         flags=re.DOTALL | re.IGNORECASE)
+    for pattern, template in _ADMONITION_PRE_PATTERNS:
+        content = pattern.sub(_make_admonition_replacer(template), content)
 
     # Pattern 2: Bare Docusaurus admonitions (not wrapped in <pre>)
     # Handles: :::tip Pro Tip (space-separated title)
     #          :::info[CLI Methods] (bracket-enclosed title)
-    for admon_type, template in admonition_types.items():
-        pattern = rf':::{admon_type}(?:\[([^\]]*)\]|\s+([^\n]*?))?\s*\n(.*?)\s*:::(?!:)'
-        def make_replacement2(template_name):
-            def replacer(match):
-                bracket_title = match.group(1)  # from :::type[Title]
-                space_title = match.group(2)     # from :::type Title
-                body = match.group(3).strip()
-                title = (bracket_title or space_title or '').strip()
-                if title:
-                    return f'{{{{{template_name}|title={title}|{body}}}}}'
-                return f'{{{{{template_name}|{body}}}}}'
-            return replacer
-        content = re.sub(pattern, make_replacement2(template), content,
-                         flags=re.DOTALL | re.IGNORECASE)
+    for pattern, template in _ADMONITION_BARE_PATTERNS:
+        content = pattern.sub(_make_admonition_replacer(template), content)
 
     # Pattern 3: Hugo alert shortcodes
     # {{< alert color="warning" title="Warning" >}} ... {{< /alert >}}
@@ -471,25 +551,15 @@ def convert_admonitions(content: str) -> str:
         attrs = match.group(1)
         body = match.group(2).strip()
         # Extract color/type — handle both straight and curly quotes
-        color_match = re.search(r'color=["\u201c](\w+)["\u201d]', attrs)
+        color_match = _RE_ALERT_COLOR.search(attrs)
         color = color_match.group(1) if color_match else 'note'
-        template = admonition_types.get(color.lower(), 'Note')
+        template = ADMONITION_TYPES.get(color.lower(), 'Note')
         return f'{{{{{template}|{body}}}}}'
 
-    content = re.sub(
-        r'\{\{[<%]\s*alert\s+(.*?)\s*[>%]\}\}(.*?)\{\{[<%]\s*/alert\s*[>%]\}\}',
-        replace_hugo_alert,
-        content,
-        flags=re.DOTALL
-    )
+    content = _RE_HUGO_ALERT.sub(replace_hugo_alert, content)
 
     # Pattern 4: HTML-escaped Hugo shortcodes (Pandoc sometimes escapes the braces)
-    content = re.sub(
-        r'\{\{&lt;\s*alert\s+(.*?)\s*&gt;\}\}(.*?)\{\{&lt;\s*/alert\s*&gt;\}\}',
-        replace_hugo_alert,
-        content,
-        flags=re.DOTALL
-    )
+    content = _RE_HUGO_ALERT_ESCAPED.sub(replace_hugo_alert, content)
 
     return content
 
@@ -524,6 +594,9 @@ def extract_frontmatter_from_hugo(source_path: str) -> Dict:
     return {}
 
 
+_RE_WHITESPACE = re.compile(r'\s+')
+
+
 def add_categories(content: str, frontmatter: Dict, source_path: Optional[str] = None) -> str:
     """
     Add MediaWiki categories based on frontmatter and source path.
@@ -572,7 +645,7 @@ def add_categories(content: str, frontmatter: Dict, source_path: Optional[str] =
     if not keywords and frontmatter.get('title'):
         title = frontmatter['title']
         # Extract meaningful words from title
-        words = [w for w in re.split(r'\s+', title) if len(w) > 3 and w[0].isupper()]
+        words = [w for w in _RE_WHITESPACE.split(title) if len(w) > 3 and w[0].isupper()]
         for word in words[:2]:
             categories.append(word.replace(' ', '_'))
 
@@ -630,6 +703,9 @@ def add_wikiseo_metadata(content: str, frontmatter: Dict) -> str:
     return seo_block + '\n' + content
 
 
+_RE_H1 = re.compile(r'^= .+ =$')
+
+
 def add_page_metadata(content: str, frontmatter: Dict) -> str:
     """
     Add metadata section at the top of the page.
@@ -641,7 +717,7 @@ def add_page_metadata(content: str, frontmatter: Dict) -> str:
         # Don't add redundant title if content already has an H1 near the top.
         # Check the first 10 non-blank lines for any = ... = heading.
         first_lines = [l for l in content.strip().splitlines()[:10] if l.strip()]
-        has_h1 = any(re.match(r'^= .+ =$', l.strip()) for l in first_lines)
+        has_h1 = any(_RE_H1.match(l.strip()) for l in first_lines)
         if not has_h1:
             metadata_parts.append(f'= {title} =')
 
@@ -656,6 +732,10 @@ def add_page_metadata(content: str, frontmatter: Dict) -> str:
     return content
 
 
+_RE_PRE_ADMONITION = re.compile(r':::(note|warning|tip|caution|info|danger)', re.IGNORECASE)
+_RE_MD_IMAGE_SPLIT = re.compile(r'(!\[[^\]]*\]\([^)]+\))')
+
+
 def extract_content_from_pre_blocks(content: str) -> str:
     """
     Pre-pass: extract images, admonitions, and other wiki content
@@ -668,18 +748,18 @@ def extract_content_from_pre_blocks(content: str) -> str:
         inner = match.group(1)
 
         # If the <pre> contains admonitions, extract them
-        if re.search(r':::(note|warning|tip|caution|info|danger)', inner, re.IGNORECASE):
+        if _RE_PRE_ADMONITION.search(inner):
             # Return without <pre> wrapper — admonition handler will process it
             return inner
 
         # If the <pre> contains markdown images, extract them and keep the rest
         if '![' in inner and '](' in inner:
             # Split into image and non-image parts
-            parts = re.split(r'(!\[[^\]]*\]\([^)]+\))', inner)
+            parts = _RE_MD_IMAGE_SPLIT.split(inner)
             result_parts = []
             text_parts = []
             for part in parts:
-                if re.match(r'^!\[', part):
+                if part.startswith('!['):
                     # Flush accumulated text as <pre> if it has content
                     if text_parts and ''.join(text_parts).strip():
                         result_parts.append(f'<pre>{"".join(text_parts)}</pre>')
@@ -695,59 +775,69 @@ def extract_content_from_pre_blocks(content: str) -> str:
         # No special content, leave as-is
         return match.group(0)
 
-    content = re.sub(r'<pre>(.*?)</pre>', process_pre, content, flags=re.DOTALL)
+    content = _RE_PRE_BLOCK.sub(process_pre, content)
     return content
 
 
+_RE_EXCESS_BLANK_LINES = re.compile(r'\n{3,}')
+_RE_TABLE_CLASS = re.compile(r'\{\|class=')
+_RE_DIV_OPEN = re.compile(r'<div[^>]*>\s*')
+_RE_DIV_CLOSE = re.compile(r'\s*</div>')
+_RE_THEME_IMPORT = re.compile(r'^import .+ from [\'"]@theme/.+[\'"];?\s*$', re.MULTILINE)
+_RE_ESCAPED_CHAR = re.compile(r'\\([\[\]|])')
+
+
 def clean_pandoc_artifacts(content: str) -> str:
     """
     Clean up common Pandoc conversion artifacts.
     """
     # Remove excessive blank lines
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    content = _RE_EXCESS_BLANK_LINES.sub('\n\n', content)
 
     # Fix broken table syntax
-    content = re.sub(r'\{\|class=', r'{| class=', content)
+    content = _RE_TABLE_CLASS.sub(r'{| class=', content)
 
     # Remove <div> tags that Pandoc sometimes adds
-    content = re.sub(r'<div[^>]*>\s*', '', content)
-    content = re.sub(r'\s*</div>', '', content)
+    content = _RE_DIV_OPEN.sub('', content)
+    content = _RE_DIV_CLOSE.sub('', content)
 
-    # Fix escaped characters
-    content = content.replace(r'\[', '[')
-    content = content.replace(r'\]', ']')
-    content = content.replace(r'\|', '|')
+    # Fix escaped characters (\[ \] \|) in one pass instead of three copies
+    content = _RE_ESCAPED_CHAR.sub(r'\1', content)
 
     # Normalize curly/smart quotes to straight quotes (Pandoc's --smart option)
+    # (str.replace returns the input untouched when there is nothing to replace;
+    # str.translate would be far slower here on non-ASCII pages)
     content = content.replace('\u201c', '"')  # Left double quotation mark
     content = content.replace('\u201d', '"')  # Right double quotation mark
     content = content.replace('\u2018', "'")  # Left single quotation mark
     content = content.replace('\u2019', "'")  # Right single quotation mark
 
     # Remove leftover Docusaurus import statements (e.g. import Tabs from '@theme/Tabs')
-    content = re.sub(r'^import .+ from [\'"]@theme/.+[\'"];?\s*$', '', content, flags=re.MULTILINE)
+    content = _RE_THEME_IMPORT.sub('', content)
 
     return content
 
 
-def _load_inventory_data(inventory_path: Optional[str] = None) -> Tuple[List[Dict], set]:
+def _load_inventory_data(inventory_path: Optional[str] = None) -> Tuple[List[InventoryRow], set]:
     """Load inventory rows and return (all_rows, skip_sources set)."""
     if not inventory_path:
         inventory_path = str(Path(__file__).parent / 'migration_inventory.csv')
     inv_path = Path(inventory_path)
     if not inv_path.exists():
         return [], set()
-    with open(inv_path, 'r', encoding='utf-8') as f:
-        rows = list(csv.DictReader(f))
+    rows = []
     skip_sources = set()
-    for row in rows:
-        if row.get('status', '') == 'Skip-EmptyDraft':
-            src = row.get('source_path', '')
-            if src:
-                skip_sources.add(src)
+    for src, target, title, keywords, status in _read_inventory(inv_path):
+        rows.append(InventoryRow(src, target, title, keywords, status,
+                                 _dirname(_rel_doc_path(src))))
+        if status == 'Skip-EmptyDraft' and src:
+            skip_sources.add(src)
     return rows, skip_sources
 
 
+_RE_INTERNAL_LINK = re.compile(r'\[\[(?!Category:|File:|#)([^\]|]+)')
+
+
 def add_see_also_section(
     content: str,
     source_path: Optional[str] = None,
@@ -764,14 +854,14 @@ def add_see_also_section(
     5. Insert before [[Category:]] tags at the end
     """
     # Count existing internal links (wiki-style)
-    existing_links = re.findall(r'\[\[(?!Category:|File:|#)([^\]|]+)', content)
+    existing_links = _RE_INTERNAL_LINK.findall(content)
     existing_count = len(existing_links)
     existing_targets = {link.strip().lower() for link in existing_links}
 
     # Determine if this is a hub page (heuristic: has many links or is _index)
     is_hub = existing_count > 15
     if source_path:
-        stem = Path(source_path).stem.lower()
+        stem = _stem(source_path).lower()
         if stem in ('index', '_index', 'introduction'):
             is_hub = True
 
@@ -793,14 +883,14 @@ def add_see_also_section(
         # Resolve to absolute then extract relative doc path
         resolved = str(Path(source_path).resolve())
         src_key = resolved
-        for marker in ['df-docs/df-docs/docs/', 'guide/dreamfactory-book-v2/content/en/docs/']:
+        for marker in DOC_PREFIXES:
             idx = src_key.find(marker)
             if idx >= 0:
                 src_key = src_key[idx + len(marker):]
                 break
-        src_no_ext = re.sub(r'\.md$', '', src_key)
-        current_target = link_map.get(src_no_ext.lower()) or link_map.get(Path(src_no_ext).stem.lower())
-        current_dir = str(Path(src_key).parent)
+        src_no_ext = _RE_MD_EXT.sub('', src_key)
+        current_target = link_map.get(src_no_ext.lower()) or link_map.get(_stem(src_no_ext).lower())
+        current_dir = _dirname(src_key)
 
     # Collect candidate pages
     see_also_links: List[Tuple[str, str]] = []  # (wiki_page, display_title)
@@ -809,33 +899,25 @@ def add_see_also_section(
     if current_target and '/' in current_target:
         parent_target = '/'.join(current_target.split('/')[:-1])
         for row in rows:
-            if row.get('source_path', '') in skip_sources:
+            if row.source_path in skip_sources:
                 continue
-            if row.get('target_wiki_page', '') == parent_target:
-                title = row.get('title', parent_target)
+            if row.target_wiki_page == parent_target:
+                title = row.title
                 if parent_target.lower() not in existing_targets:
                     see_also_links.append((parent_target, title))
                 break
 
-    # Helper: extract relative doc path from an inventory source_path
-    def _rel_doc_path(inv_src: str) -> str:
-        for pfx in ['df-docs/df-docs/docs/', 'guide/dreamfactory-book-v2/content/en/docs/']:
-            if inv_src.startswith(pfx):
-                return inv_src[len(pfx):]
-        return inv_src
-
     # Find sibling pages (same directory in source)
-    if current_dir:
+    if current_dir is not None:
         for row in rows:
-            src = row.get('source_path', '')
+            src = row.source_path
             if src in skip_sources:
                 continue
-            target = row.get('target_wiki_page', '')
-            title = row.get('title', '')
+            target = row.target_wiki_page
+            title = row.title
             if not target or not title:
                 continue
-            row_dir = str(Path(_rel_doc_path(src)).parent)
-            if row_dir == current_dir and target != current_target:
+            if row.rel_dir == current_dir and target != current_target:
                 if target.lower() not in existing_targets:
                     see_also_links.append((target, title))
 
@@ -844,29 +926,29 @@ def add_see_also_section(
     current_src_rel = None
     if source_path:
         resolved = str(Path(source_path).resolve())
-        for marker in ['df-docs/df-docs/docs/', 'guide/dreamfactory-book-v2/content/en/docs/']:
+        for marker in DOC_PREFIXES:
             idx = resolved.find(marker)
             if idx >= 0:
                 current_src_rel = resolved[idx:]
                 break
         for row in rows:
-            row_src = row.get('source_path', '')
+            row_src = row.source_path
             if row_src == current_src_rel or (current_src_rel and current_src_rel.endswith(row_src)):
-                kw = row.get('keywords', '')
+                kw = row.keywords
                 if kw:
                     current_keywords = {k.strip().lower() for k in kw.split(',') if k.strip()}
                 break
 
     if current_keywords:
         for row in rows:
-            src = row.get('source_path', '')
+            src = row.source_path
             if src in skip_sources or src == source_path:
                 continue
-            target = row.get('target_wiki_page', '')
-            title = row.get('title', '')
+            target = row.target_wiki_page
+            title = row.title
             if not target or not title:
                 continue
-            row_kw = row.get('keywords', '')
+            row_kw = row.keywords
             if row_kw:
                 row_keywords = {k.strip().lower() for k in row_kw.split(',') if k.strip()}
                 overlap = current_keywords & row_keywords
@@ -891,20 +973,17 @@ def add_see_also_section(
 
     # Build See also section
     see_also_lines = ['\n== See also ==']
-    for target, title in unique_links:
-        see_also_lines.append(f'* [[{target}|{title}]]')
-
+    see_also_lines.extend(f'* [[{target}|{title}]]' for target, title in unique_links)
     see_also_text = '\n'.join(see_also_lines) + '\n'
 
     # Insert before [[Category:]] tags at the end, or append
-    category_match = re.search(r'\n\[\[Category:', content)
-    if category_match:
-        insert_pos = category_match.start()
-        content = content[:insert_pos] + '\n' + see_also_text + content[insert_pos:]
-    else:
-        content = content.rstrip() + '\n' + see_also_text
-
-    return content
+    # Plain substring scan; no regex needed for a literal marker. This must be
+    # the first category tag (not rfind) so the section lands above all of them.
+    insert_pos = content.find('\n[[Category:')
+    if insert_pos >= 0:
+        # Single join so the result is sized once instead of copying the page per '+'
+        return ''.join((content[:insert_pos], '\n', see_also_text, content[insert_pos:]))
+    return ''.join((content.rstrip(), '\n', see_also_text))
 
 
 def postprocess_wiki_file(wiki_path: str, source_path: Optional[str] = None) -> bool:
@@ -924,7 +1003,7 @@ def postprocess_wiki_file(wiki_path: str, source_path: Optional[str] = None) ->
     """
     try:
         with open(wiki_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            original = content = f.read()
 
         # Get frontmatter from source if available
         frontmatter = {}
@@ -946,7 +1025,9 @@ def postprocess_wiki_file(wiki_path: str, source_path: Optional[str] = None) ->
         content = add_page_metadata(content, frontmatter)
         content = add_wikiseo_metadata(content, frontmatter)
 
-        # Write back
+        # Write back (skipped when nothing changed, e.g. on a re-run)
+        if content == original:
+            return True
         with open(wiki_path, 'w', encoding='utf-8') as f:
             f.write(content)
 
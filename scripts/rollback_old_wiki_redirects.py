@@ -16,6 +16,8 @@ Usage:
 import json
 import argparse
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 try:
@@ -24,11 +26,27 @@ except ImportError:
     print("Error: mwclient not installed. Run: pip install mwclient")
     sys.exit(1)
 
+try:
+    import orjson  # Optional: faster page_map.json (de)serialization
+except ImportError:
+    orjson = None
+
 
 SCRIPT_DIR = Path(__file__).parent
 DEFAULT_MAP_FILE = SCRIPT_DIR / 'old_wiki_redirect_map.json'
 PAGE_MAP_FILE = SCRIPT_DIR.parent / 'docs' / 'page_map.json'
 REDIRECTS_DIR = SCRIPT_DIR.parent / 'docs' / 'redirects'
+API_BATCH_SIZE = 50  # Max titles per API query for non-bot accounts
+DELETE_WORKERS = 4
+DELETE_REASON = 'Rollback: removing old wiki redirect/hub/stub page'
+
+_print_lock = threading.Lock()
+
+
+def log(msg: str):
+    """print() that keeps lines from concurrent delete workers intact."""
+    with _print_lock:
+        print(msg)
 
 
 def connect_wiki(wiki_url: str, username: str = None, password: str = None):
@@ -50,6 +68,56 @@ def connect_wiki(wiki_url: str, username: str = None, password: str = None):
     return site
 
 
+def existing_titles(site, titles: list) -> set:
+    """Return the subset of titles that exist, using one query per 50 titles."""
+    existing = set()
+    for i in range(0, len(titles), API_BATCH_SIZE):
+        batch = titles[i:i + API_BATCH_SIZE]
+        data = site.api('query', titles='|'.join(batch))
+        query = data.get('query', {})
+        normalized = {n['from']: n['to'] for n in query.get('normalized', [])}
+        found = {p['title'] for p in query.get('pages', {}).values() if 'missing' not in p}
+        existing.update(t for t in batch if normalized.get(t, t) in found)
+    return existing
+
+
+def delete_page(site, old_path: str) -> bool:
+    """Delete one page, logging the outcome. Returns True on success."""
+    try:
+        site.pages[old_path].delete(reason=DELETE_REASON)
+        log(f'  [DELETED] {old_path}')
+        return True
+    except mwclient.errors.APIError as e:
+        if 'permissiondenied' in str(e).lower() or 'cantdelete' in str(e).lower():
+            log(f'  [FAIL] {old_path} (permission denied - needs sysop)')
+        else:
+            log(f'  [FAIL] {old_path} ({e})')
+    except Exception as e:
+        log(f'  [FAIL] {old_path} ({e})')
+    return False
+
+
+def load_json(path: Path):
+    """Read a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def dump_page_map(page_map: dict, path: Path):
+    """Write page_map.json sorted, 2-space indented, UTF-8, trailing newline."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(
+            page_map,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+        ))
+    else:
+        path.write_text(
+            json.dumps(page_map, indent=2, sort_keys=True, ensure_ascii=False) + '\n',
+            encoding='utf-8'
+        )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Rollback old wiki redirect pages'
@@ -71,7 +139,7 @@ def main():
         print(f'Error: Map file not found: {args.map_file}')
         return 1
 
-    entries = json.loads(args.map_file.read_text(encoding='utf-8'))
+    entries = load_json(args.map_file)
 
     # Filter to only entries that created pages
     actionable = [e for e in entries if e['strategy'] != 'no-action']
@@ -80,73 +148,70 @@ def main():
         print('No pages to roll back.')
         return 0
 
-    # Connect to wiki
-    print(f'Connecting to {args.wiki_url}...')
-    try:
-        site = connect_wiki(args.wiki_url, args.username, args.password)
-    except Exception as e:
-        print(f'Error connecting: {e}')
-        return 1
-    print('Connected.\n')
-
     # Delete pages
     deleted = 0
     not_found = 0
     failed = 0
 
-    for entry in actionable:
-        old_path = entry['old_path']
-        page = site.pages[old_path]
-
-        if not page.exists:
-            print(f'  [SKIP] {old_path} (does not exist)')
-            not_found += 1
-            continue
+    old_paths = [entry['old_path'] for entry in actionable]
 
-        if args.dry_run:
+    # A dry run only lists the map, so it never connects to the wiki
+    if args.dry_run:
+        for old_path in old_paths:
             print(f'  [DRY RUN] Would delete: {old_path}')
             deleted += 1
-            continue
-
+    else:
+        print(f'Connecting to {args.wiki_url}...')
         try:
-            page.delete(reason='Rollback: removing old wiki redirect/hub/stub page')
-            print(f'  [DELETED] {old_path}')
-            deleted += 1
-        except mwclient.errors.APIError as e:
-            if 'permissiondenied' in str(e).lower() or 'cantdelete' in str(e).lower():
-                print(f'  [FAIL] {old_path} (permission denied - needs sysop)')
-            else:
-                print(f'  [FAIL] {old_path} ({e})')
-            failed += 1
+            site = connect_wiki(args.wiki_url, args.username, args.password)
         except Exception as e:
-            print(f'  [FAIL] {old_path} ({e})')
-            failed += 1
+            print(f'Error connecting: {e}')
+            return 1
+        print('Connected.\n')
+
+        existing = existing_titles(site, old_paths)
+        to_delete = []
+        for old_path in old_paths:
+            if old_path not in existing:
+                print(f'  [SKIP] {old_path} (does not exist)')
+                not_found += 1
+            else:
+                to_delete.append(old_path)
+
+        # Each delete is a blocking round-trip; mwclient honours maxlag per call
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            futures = [executor.submit(delete_page, site, old_path) for old_path in to_delete]
+            for future in as_completed(futures):
+                if future.result():
+                    deleted += 1
+                else:
+                    failed += 1
 
     # Optionally clean up local files
     if args.clean_files and not args.dry_run:
         print('\nCleaning up local files...')
         page_map = {}
         if PAGE_MAP_FILE.exists():
-            page_map = json.loads(PAGE_MAP_FILE.read_text(encoding='utf-8'))
+            page_map = load_json(PAGE_MAP_FILE)
 
         files_removed = 0
+        drop = set()
         for entry in actionable:
-            old_path = entry['old_path']
-            filename = old_path.replace('/', '_') + '.wiki'
+            filename = entry['old_path'].replace('/', '_') + '.wiki'
+            if filename in drop:
+                continue  # Duplicate entry
+            drop.add(filename)
             filepath = REDIRECTS_DIR / filename
-            page_map_key = f'redirects/{filename}'
-
             if filepath.exists():
                 filepath.unlink()
                 files_removed += 1
 
-            page_map.pop(page_map_key, None)
+        # Rebuild the map in one pass rather than popping key by key
+        drop = {f'redirects/{filename}' for filename in drop}
+        page_map = {k: v for k, v in page_map.items() if k not in drop}
 
         # Save updated page_map
-        PAGE_MAP_FILE.write_text(
-            json.dumps(page_map, indent=2, sort_keys=True, ensure_ascii=False) + '\n',
-            encoding='utf-8'
-        )
+        dump_page_map(page_map, PAGE_MAP_FILE)
         print(f'  Removed {files_removed} local .wiki files')
         print(f'  Updated {PAGE_MAP_FILE}')
 
@@ -22,11 +22,13 @@ import json
 import csv
 import re
 import argparse
+import functools
+import hashlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 try:
     import mwclient
@@ -35,11 +37,70 @@ except ImportError:
     print("Error: Missing dependencies. Run: pip install mwclient pyyaml")
     sys.exit(1)
 
+try:
+    import orjson  # Optional: faster .last_sync.json / page_map.json handling
+except ImportError:
+    orjson = None
+
+import postprocess
 from postprocess import add_categories, add_see_also_section
 
 
 SCRIPT_DIR = Path(__file__).parent
 LAST_SYNC_FILE = SCRIPT_DIR / '.last_sync.json'
+API_BATCH_SIZE = 50  # Max titles per API query for non-bot accounts
+DEFAULT_WORKERS = 8
+PANDOC_WORKERS = 4  # pandoc is CPU-bound; a few processes at a time
+SOURCE_SUFFIXES = ('.wiki', '.md')
+
+_HYPHEN_TO_UNDERSCORE = str.maketrans('-', '_')
+
+
+def _content_sha1(content: str) -> str:
+    """SHA-1 of content as MediaWiki stores it (\\r\\n normalized, trailing whitespace stripped)."""
+    return hashlib.sha1(content.replace('\r\n', '\n').rstrip().encode('utf-8')).hexdigest()
+
+
+def _enrichment_fingerprint() -> str:
+    """Hash of the inputs _enrich_content reads besides the source itself.
+
+    Categories and see-also links come from the inventory CSV through
+    postprocess, so a change to either must redeploy unchanged sources.
+    """
+    digest = hashlib.sha256()
+    for path in (SCRIPT_DIR / 'migration_inventory.csv', Path(postprocess.__file__)):
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            pass
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def _auto_page_name(rel_path: str) -> str:
+    """Derive a wiki page name from a docs-relative file path.
+
+    e.g. "getting-started/docker-installation.wiki" → "Getting_Started/Docker_Installation"
+    """
+    name = str(Path(rel_path).with_suffix(''))
+    return '/'.join(
+        '_'.join(map(str.capitalize, part.translate(_HYPHEN_TO_UNDERSCORE).split('_')))
+        for part in name.split('/')
+    )
+
+
+def _iter_source_files(source_path: Path) -> Iterator[Path]:
+    """Yield .wiki/.md files under source_path in one walk.
+
+    Same files as the rglob('*.wiki') + rglob('*.md') it replaces: hidden
+    directories are walked too (dot-files are filtered later by name), and
+    symlinked directories are not followed, as rglob doesn't on Python < 3.13.
+    """
+    for dirpath, _dirnames, filenames in os.walk(source_path, followlinks=False):
+        for filename in filenames:
+            if filename.endswith(SOURCE_SUFFIXES):
+                yield Path(dirpath, filename)
 
 
 class WikiSyncer:
@@ -51,16 +112,32 @@ class WikiSyncer:
         self.password = password
         self.site = None
         self.last_sync = self._load_last_sync()
+        self._remote_sha1: Dict[str, str] = {}  # page → latest revision sha1, from check_conflicts
+        self._page_names: Dict[Tuple[Path, Path], str] = {}  # get_page_name_from_path memo
 
     def _load_last_sync(self) -> Dict:
-        """Load last sync metadata."""
+        """Load last sync metadata.
+
+        'hashes' maps page name → sha256 of the source last deployed to it
+        (with its page name and the enrichment inputs); 'deployed' maps page
+        name → sha1 of the text that deploy saved, to compare with the wiki's.
+        """
         if LAST_SYNC_FILE.exists():
-            return json.loads(LAST_SYNC_FILE.read_text())
-        return {'timestamp': None, 'pages': {}}
+            if orjson is not None:
+                data = orjson.loads(LAST_SYNC_FILE.read_bytes())
+            else:
+                data = json.loads(LAST_SYNC_FILE.read_text())
+            data.setdefault('hashes', {})
+            data.setdefault('deployed', {})
+            return data
+        return {'timestamp': None, 'pages': {}, 'hashes': {}, 'deployed': {}}
 
     def _save_last_sync(self):
         """Save sync metadata."""
-        LAST_SYNC_FILE.write_text(json.dumps(self.last_sync, indent=2))
+        if orjson is not None:
+            LAST_SYNC_FILE.write_bytes(orjson.dumps(self.last_sync, option=orjson.OPT_INDENT_2))
+        else:
+            LAST_SYNC_FILE.write_text(json.dumps(self.last_sync, indent=2))
 
     def connect(self) -> bool:
         """Connect to MediaWiki."""
@@ -93,51 +170,87 @@ class WikiSyncer:
         conflicts = []
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
-        for page_name in pages:
-            page = self.site.pages[page_name]
-            if page.exists:
-                for rev in page.revisions(limit=1):
-                    # mwclient returns time.struct_time objects
-                    ts = rev['timestamp']
-                    if isinstance(ts, time.struct_time):
-                        rev_time = datetime(*ts[:6], tzinfo=timezone.utc)
-                    else:
-                        rev_time = datetime.strptime(
-                            str(ts), '%Y-%m-%dT%H:%M:%SZ'
-                        ).replace(tzinfo=timezone.utc)
-                    if rev_time > cutoff:
-                        # Check if this was our bot
-                        if rev.get('user') != self.username:
-                            conflicts.append({
-                                'page': page_name,
-                                'editor': rev.get('user', 'unknown'),
-                                'timestamp': rev_time.isoformat(),
-                                'comment': rev.get('comment', '')
-                            })
+        # One revisions query per batch of titles instead of an exists check
+        # plus a revisions call per page. With several titles the API returns
+        # only the latest revision of each page (rvlimit is single-page only).
+        for i in range(0, len(pages), API_BATCH_SIZE):
+            batch = pages[i:i + API_BATCH_SIZE]
+            data = self.site.api(
+                'query',
+                prop='revisions',
+                titles='|'.join(batch),
+                rvprop='timestamp|user|comment|sha1',
+            )
+            query = data.get('query', {})
+            normalized = {n['from']: n['to'] for n in query.get('normalized', [])}
+            latest = {}
+            for page in query.get('pages', {}).values():
+                if 'missing' in page or not page.get('revisions'):
+                    continue
+                latest[page['title']] = page['revisions'][0]
+
+            for page_name in batch:
+                rev = latest.get(normalized.get(page_name, page_name))
+                if rev is None:
+                    continue
+                self._remote_sha1[page_name] = rev.get('sha1', '')
+                rev_time = datetime.fromisoformat(rev['timestamp'].replace('Z', '+00:00'))
+                if rev_time > cutoff:
+                    # Check if this was our bot
+                    if rev.get('user') != self.username:
+                        conflicts.append({
+                            'page': page_name,
+                            'editor': rev.get('user', 'unknown'),
+                            'timestamp': rev_time.isoformat(),
+                            'comment': rev.get('comment', '')
+                        })
 
         return conflicts
 
-    def convert_markdown_to_wiki(self, md_file: Path) -> Optional[str]:
-        """Convert markdown file to MediaWiki format using pandoc."""
+    def convert_markdown_to_wiki(self, md_file: Path, text: Optional[str] = None) -> Optional[str]:
+        """Convert markdown file to MediaWiki format using pandoc.
+
+        If the file's text is already in memory, pass it as text and it is
+        piped to pandoc instead of pandoc re-reading the file.
+        """
+        cmd = ['pandoc', '-f', 'markdown', '-t', 'mediawiki']
+        if text is None:
+            cmd.append(str(md_file))
         try:
             result = subprocess.run(
-                ['pandoc', '-f', 'markdown', '-t', 'mediawiki', str(md_file)],
+                cmd,
+                input=text,
                 capture_output=True,
                 text=True,
                 check=True
             )
             return result.stdout
         except subprocess.CalledProcessError as e:
-            print(f"  ✗ Pandoc conversion failed: {e.stderr}")
+            print(f"  ✗ Pandoc conversion failed for {md_file}: {e.stderr}")
             return None
         except FileNotFoundError:
             print("  ✗ Pandoc not installed")
             return None
 
+    def convert_markdown_batch(self, md_sources: List[Tuple[Path, str]]) -> List[Optional[str]]:
+        """Convert many markdown sources, one pandoc process each, on a small thread pool.
+
+        Each source must be its own pandoc document: reference link
+        definitions and footnotes are document-global, so sources joined
+        into one run would resolve each other's ids. Results are in input order.
+        """
+        if len(md_sources) < 2:
+            return [self.convert_markdown_to_wiki(path, text) for path, text in md_sources]
+        with ThreadPoolExecutor(max_workers=PANDOC_WORKERS) as executor:
+            return list(executor.map(lambda source: self.convert_markdown_to_wiki(*source),
+                                     md_sources))
+
     def _load_page_map(self, source_dir: Path) -> Dict[str, str]:
         """Load page_map.json from source directory if it exists."""
         map_file = source_dir / 'page_map.json'
         if map_file.exists():
+            if orjson is not None:
+                return orjson.loads(map_file.read_bytes())
             return json.loads(map_file.read_text(encoding='utf-8'))
         return {}
 
@@ -177,7 +290,14 @@ class WikiSyncer:
         """Generate wiki page name from file path.
 
         Lookup order: inventory CSV → page_map.json → auto-generate.
+        Results are memoized per (file_path, source_dir) on this instance.
         """
+        key = (file_path, source_dir)
+        if key not in self._page_names:
+            self._page_names[key] = self._resolve_page_name(file_path, source_dir)
+        return self._page_names[key]
+
+    def _resolve_page_name(self, file_path: Path, source_dir: Path) -> str:
         rel_path = str(file_path.relative_to(source_dir))
 
         # 1. Check inventory CSV mapping (content pages)
@@ -193,13 +313,7 @@ class WikiSyncer:
             return self._page_map[rel_path]
 
         # 3. Auto-generate (last resort)
-        name = str(Path(rel_path).with_suffix(''))
-        parts = name.split('/')
-        wiki_name = '/'.join(
-            '_'.join(word.capitalize() for word in part.replace('-', '_').split('_'))
-            for part in parts
-        )
-        return wiki_name
+        return _auto_page_name(rel_path)
 
     def _auto_add_inventory_entries(self, source_files: List[Path], source_dir: Path) -> int:
         """Detect unmapped .wiki files and append them to the inventory CSV."""
@@ -220,12 +334,7 @@ class WikiSyncer:
             if src_file.name.startswith('.') or src_file.name == 'page_map.json':
                 continue
             # Generate wiki page name (same logic as auto-generate fallback)
-            name = str(Path(rel_path).with_suffix(''))
-            parts = name.split('/')
-            wiki_name = '/'.join(
-                '_'.join(word.capitalize() for word in part.replace('-', '_').split('_'))
-                for part in parts
-            )
+            wiki_name = _auto_page_name(rel_path)
             title = Path(rel_path).stem.replace('-', ' ').replace('_', ' ').title()
             new_entries.append((rel_path, wiki_name, title))
 
@@ -243,6 +352,7 @@ class WikiSyncer:
                 ])
                 # Update in-memory cache so get_page_name_from_path() uses it
                 self._inventory_map[rel_path] = wiki_name
+        self._page_names.clear()
 
         print(f"\nAuto-added {len(new_entries)} new page(s) to inventory CSV:")
         for rel_path, wiki_name, _ in new_entries:
@@ -288,22 +398,43 @@ class WikiSyncer:
             print(f"  ⚠ enrich warning for {source_path}: {e}")
         return content
 
+    def is_unchanged(self, page_name: str, content: str) -> bool:
+        """True if the wiki's latest revision already holds this content.
+
+        Compares against the revision sha1 fetched by check_conflicts. MediaWiki
+        stores text with \\r\\n normalized and trailing whitespace stripped, so
+        hash it the same way.
+        """
+        remote = self._remote_sha1.get(page_name)
+        if not remote:
+            return False
+        return _content_sha1(content) == remote
+
     def deploy_page(self, page_name: str, content: str, summary: str = None) -> bool:
-        """Deploy a single page to wiki."""
+        """Deploy a single page to wiki. Identical content is not re-saved."""
         if not summary:
             summary = "Automated sync from GitHub"
 
+        if self.is_unchanged(page_name, content):
+            print(f"  = {page_name} (unchanged)")
+            return True
+
         try:
             page = self.site.pages[page_name]
-            page.save(content, summary=summary)
+            page.edit(content, summary=summary, bot=True)
             print(f"  ✓ {page_name}")
             return True
         except Exception as e:
             print(f"  ✗ {page_name}: {e}")
             return False
 
-    def sync_directory(self, source_dir: str, dry_run: bool = False, force: bool = False) -> Dict:
-        """Sync all wiki/markdown files from directory to wiki."""
+    def sync_directory(self, source_dir: str, dry_run: bool = False, force: bool = False,
+                       workers: int = DEFAULT_WORKERS) -> Dict:
+        """Sync all wiki/markdown files from directory to wiki.
+
+        Content is prepared serially; the page saves (blocking HTTPS POSTs)
+        run on a pool of ``workers`` threads.
+        """
         source_path = Path(source_dir)
         stats = {'success': 0, 'failed': 0, 'skipped': 0}
 
@@ -311,21 +442,23 @@ class WikiSyncer:
             print(f"Error: Source directory not found: {source_dir}")
             return stats
 
-        # Collect both .wiki and .md files
-        source_files = sorted(
-            list(source_path.rglob('*.wiki')) + list(source_path.rglob('*.md'))
-        )
+        # Collect both .wiki and .md files (sorted for deterministic order)
+        source_files = sorted(_iter_source_files(source_path))
         print(f"\nSyncing {len(source_files)} files from {source_dir}")
 
         # Auto-add any unmapped files to inventory CSV
         self._auto_add_inventory_entries(source_files, source_path)
 
-        # Check for conflicts first
-        page_names = [
-            self.get_page_name_from_path(f, source_path)
+        # Resolve page names once for both the conflict check and deploy
+        sources = [
+            (f, self.get_page_name_from_path(f, source_path))
             for f in source_files
+            if not f.name.startswith('.') and f.name != '_ai-reference.md'
         ]
-        conflicts = self.check_conflicts(page_names, hours=24)
+        stats['skipped'] += len(source_files) - len(sources)
+
+        # Check for conflicts first
+        conflicts = self.check_conflicts([page_name for _, page_name in sources], hours=24)
 
         if conflicts:
             print("\n⚠️  WARNING: Potential conflicts detected!")
@@ -345,39 +478,85 @@ class WikiSyncer:
                     return stats
 
         print("\nDeploying pages:")
-        for src_file in source_files:
-            if src_file.name.startswith('.') or src_file.name == '_ai-reference.md':
+        fingerprint = _enrichment_fingerprint()
+        hashes = self.last_sync['hashes']
+        deployed = self.last_sync['deployed']
+        pending = []     # (src_file, page_name, wiki_content, source_hash)
+        to_convert = []  # (src_file, page_name, source_text, source_hash)
+        for src_file, page_name in sources:
+            # Skip conversion and upload when neither the source nor the
+            # enrichment inputs changed since the last deploy, and the wiki
+            # still holds exactly what was deployed (no edits since)
+            source_text = src_file.read_text(encoding='utf-8')
+            source_hash = hashlib.sha256(
+                f'{fingerprint}\0{page_name}\0{source_text}'.encode('utf-8')).hexdigest()
+            if (not force and hashes.get(page_name) == source_hash
+                    and deployed.get(page_name)
+                    and deployed[page_name] == self._remote_sha1.get(page_name)):
                 stats['skipped'] += 1
                 continue
 
-            page_name = self.get_page_name_from_path(src_file, source_path)
-
             if dry_run:
                 print(f"  [DRY RUN] Would deploy: {page_name}")
                 stats['success'] += 1
                 continue
 
             # .wiki files are already MediaWiki markup; .md files need conversion
-            if src_file.suffix == '.wiki':
-                wiki_content = src_file.read_text(encoding='utf-8')
-            else:
-                wiki_content = self.convert_markdown_to_wiki(src_file)
+            if src_file.suffix != '.wiki':
+                to_convert.append((src_file, page_name, source_text, source_hash))
+                continue
 
             # Enrich: auto-add categories, see-also links, and SEO metadata
-            if wiki_content and src_file.suffix == '.wiki':
+            wiki_content = source_text
+            if wiki_content:
                 wiki_content = self._enrich_content(wiki_content, str(src_file), page_name)
 
             if wiki_content:
-                if self.deploy_page(page_name, wiki_content):
+                pending.append((src_file, page_name, wiki_content, source_hash))
+            else:
+                stats['failed'] += 1
+
+        # Convert the markdown sources, a few pandoc processes at a time
+        if to_convert:
+            converted = self.convert_markdown_batch(
+                [(src_file, source_text) for src_file, _, source_text, _ in to_convert]
+            )
+            for (src_file, page_name, _, source_hash), wiki_content in zip(to_convert, converted):
+                if wiki_content:
+                    pending.append((src_file, page_name, wiki_content, source_hash))
+                else:
+                    stats['failed'] += 1
+
+        # Skip saves that would only create a null revision
+        to_deploy = []
+        for src_file, page_name, wiki_content, source_hash in pending:
+            if self.is_unchanged(page_name, wiki_content):
+                print(f"  = {page_name} (unchanged)")
+                stats['skipped'] += 1
+                hashes[page_name] = source_hash
+                deployed[page_name] = self._remote_sha1[page_name]
+            else:
+                to_deploy.append((src_file, page_name, wiki_content, source_hash))
+
+        # Results are collected on this thread, so stats/last_sync need no lock
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(self.deploy_page, page_name, wiki_content):
+                    (src_file, page_name, source_hash, _content_sha1(wiki_content))
+                for src_file, page_name, wiki_content, source_hash in to_deploy
+            }
+            for future in as_completed(futures):
+                src_file, page_name, source_hash, content_sha1 = futures[future]
+                if future.result():
                     stats['success'] += 1
                     self.last_sync['pages'][page_name] = {
                         'source': str(src_file),
                         'timestamp': datetime.now(timezone.utc).isoformat()
                     }
+                    hashes[page_name] = source_hash
+                    deployed[page_name] = content_sha1
                 else:
                     stats['failed'] += 1
-            else:
-                stats['failed'] += 1
 
         self.last_sync['timestamp'] = datetime.now(timezone.utc).isoformat()
         self._save_last_sync()
@@ -420,7 +599,9 @@ def main():
     parser.add_argument('--dry-run', '-n', action='store_true',
                         help='Show what would be done')
     parser.add_argument('--force', '-f', action='store_true',
-                        help='Deploy despite conflicts (for CI/CD)')
+                        help='Deploy despite conflicts and redeploy unchanged sources (for CI/CD)')
+    parser.add_argument('--workers', '-w', type=int, default=DEFAULT_WORKERS,
+                        help=f'Concurrent page uploads (default: {DEFAULT_WORKERS})')
     parser.add_argument('--wiki-url', help='Wiki URL (or WIKI_URL env var)')
     parser.add_argument('--username', '-u', help='Wiki username (or WIKI_USER env var)')
     parser.add_argument('--password', '-p', help='Wiki password (or WIKI_PASSWORD env var)')
@@ -455,7 +636,8 @@ def main():
         return 0 if syncer.verify_deployment() else 1
 
     if args.deploy and args.source:
-        stats = syncer.sync_directory(args.source, dry_run=args.dry_run, force=args.force)
+        stats = syncer.sync_directory(args.source, dry_run=args.dry_run, force=args.force,
+                                      workers=args.workers)
         return 0 if stats['failed'] == 0 else 1
 
     parser.print_help()
@@ -0,0 +1,158 @@
+"""Tests for WikiSyncer conversion and deploy skipping (pandoc and the wiki are faked)."""
+
+import hashlib
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import sync_to_wiki
+from sync_to_wiki import WikiSyncer
+
+
+def fake_pandoc(fail_on=()):
+    """A subprocess.run stand-in that 'converts' stdin by upper-casing it."""
+    calls = []
+
+    def run(cmd, input=None, **kwargs):
+        calls.append((cmd, input))
+        if input in fail_on:
+            raise subprocess.CalledProcessError(1, cmd, stderr='boom')
+        return subprocess.CompletedProcess(cmd, 0, stdout=input.upper(), stderr='')
+
+    return run, calls
+
+
+@pytest.fixture
+def syncer():
+    return WikiSyncer('http://localhost:8082')
+
+
+def test_batch_runs_one_pandoc_per_source_in_order(syncer, monkeypatch):
+    run, calls = fake_pandoc()
+    monkeypatch.setattr(sync_to_wiki.subprocess, 'run', run)
+    # Reference ids and footnotes reused across files must not be shared
+    sources = [(Path(f'{name}.md'), f'[x][id] {name}\n\n[id]: http://{name}.example/\n')
+               for name in ('a', 'b', 'c', 'd', 'e')]
+
+    converted = syncer.convert_markdown_batch(sources)
+
+    assert converted == [text.upper() for _, text in sources]
+    assert sorted(input for _, input in calls) == sorted(text for _, text in sources)
+    # The text is piped in; pandoc doesn't re-read the file
+    assert all(cmd == ['pandoc', '-f', 'markdown', '-t', 'mediawiki'] for cmd, _ in calls)
+
+
+def test_batch_failure_only_affects_that_source(syncer, monkeypatch):
+    run, _ = fake_pandoc(fail_on={'bad'})
+    monkeypatch.setattr(sync_to_wiki.subprocess, 'run', run)
+
+    converted = syncer.convert_markdown_batch(
+        [(Path('a.md'), 'one'), (Path('b.md'), 'bad'), (Path('c.md'), 'three')])
+
+    assert converted == ['ONE', None, 'THREE']
+
+
+def test_batch_without_pandoc_returns_none_for_all(syncer, monkeypatch):
+    def run(cmd, **kwargs):
+        raise FileNotFoundError(cmd[0])
+
+    monkeypatch.setattr(sync_to_wiki.subprocess, 'run', run)
+
+    assert syncer.convert_markdown_batch([(Path('a.md'), 'x'), (Path('b.md'), 'y')]) == [None, None]
+
+
+def test_single_source_is_converted_directly(syncer, monkeypatch):
+    run, calls = fake_pandoc()
+    monkeypatch.setattr(sync_to_wiki.subprocess, 'run', run)
+
+    assert syncer.convert_markdown_batch([(Path('a.md'), 'only')]) == ['ONLY']
+    assert len(calls) == 1
+    assert syncer.convert_markdown_batch([]) == []
+
+
+class FakeWiki:
+    """Minimal mwclient Site: revision sha1s for check_conflicts and page.edit for deploys."""
+
+    def __init__(self):
+        self.texts = {}
+        self.edits = []
+        self.pages = self
+
+    def __getitem__(self, name):
+        wiki = self
+
+        class Page:
+            def edit(self, content, **kwargs):
+                wiki.texts[name] = content.rstrip()
+                wiki.edits.append(name)
+
+        return Page()
+
+    def api(self, action, titles, **kwargs):
+        pages = {}
+        for i, title in enumerate(titles.split('|')):
+            if title in self.texts:
+                sha1 = hashlib.sha1(self.texts[title].encode('utf-8')).hexdigest()
+                pages[str(i)] = {'title': title, 'revisions': [
+                    {'timestamp': '2020-01-01T00:00:00Z', 'user': 'Bot', 'sha1': sha1}]}
+            else:
+                pages[str(-1 - i)] = {'title': title, 'missing': ''}
+        return {'query': {'pages': pages}}
+
+
+@pytest.fixture
+def sync_env(tmp_path, monkeypatch):
+    """A docs dir with two pages, a private .last_sync.json and a fake wiki."""
+    monkeypatch.setattr(sync_to_wiki, 'LAST_SYNC_FILE', tmp_path / '.last_sync.json')
+    monkeypatch.setattr(WikiSyncer, '_auto_add_inventory_entries', lambda self, *args: 0)
+    docs = tmp_path / 'docs'
+    docs.mkdir()
+    (docs / 'first-page.wiki').write_text('First page text\n', encoding='utf-8')
+    (docs / 'second-page.wiki').write_text('Second page text\n', encoding='utf-8')
+    wiki = FakeWiki()
+
+    def sync(force=False):
+        syncer = WikiSyncer('http://localhost:8082', 'Bot', 'secret')
+        syncer.site = wiki
+        wiki.edits.clear()
+        return syncer.sync_directory(str(docs), force=force)
+
+    return sync, wiki
+
+
+def test_unchanged_source_is_skipped(sync_env):
+    sync, wiki = sync_env
+    assert sync()['success'] == 2
+
+    stats = sync()
+
+    assert stats == {'success': 0, 'failed': 0, 'skipped': 2}
+    assert wiki.edits == []
+
+
+def test_page_edited_on_the_wiki_is_redeployed(sync_env):
+    sync, wiki = sync_env
+    sync()
+    wiki.texts['First_Page'] = 'Vandalized'
+
+    stats = sync()
+
+    assert wiki.edits == ['First_Page']
+    assert stats['success'] == 1 and stats['skipped'] == 1
+    assert wiki.texts['First_Page'].endswith('First page text')
+
+
+def test_force_bypasses_the_source_hash_skip(sync_env, monkeypatch):
+    sync, wiki = sync_env
+    sync()
+    prepared = []
+    enrich = WikiSyncer._enrich_content
+    monkeypatch.setattr(WikiSyncer, '_enrich_content', staticmethod(
+        lambda content, *args: prepared.append(content) or enrich(content, *args)))
+
+    sync(force=True)
+
+    # Both sources are prepared again; identical results still aren't re-saved
+    assert len(prepared) == 2
+    assert wiki.edits == []
@@ -0,0 +1,63 @@
+"""Tests for update_messaging.update_page replacement and save behaviour."""
+
+from update_messaging import PageText, update_page
+
+
+class FakeSite:
+    """Records action=edit calls and answers them with a fixed result."""
+
+    def __init__(self, result='Success'):
+        self.result = result
+        self.edits = []
+
+    def get_token(self, kind):
+        return 'token'
+
+    def api(self, action, **kwargs):
+        assert action == 'edit'
+        self.edits.append(kwargs)
+        return {'edit': {'result': self.result}}
+
+
+def texts(text):
+    return {'Page': PageText(text, '2026-01-01T00:00:00Z', '2026-01-02T00:00:00Z')}
+
+
+def test_longest_anchor_wins_over_its_prefix():
+    site = FakeSite()
+    # The short anchor is a prefix of the long one; listing it first must
+    # not stop the long one from matching
+    replacements = [('DreamFactory is', 'SHORT'), ('DreamFactory is a platform.', 'LONG')]
+
+    assert update_page(site, 'Page', replacements, texts('x DreamFactory is a platform. y DreamFactory is z'))
+    assert site.edits[0]['text'] == 'x LONG y SHORT z'
+
+
+def test_only_first_occurrence_is_replaced():
+    site = FakeSite()
+
+    update_page(site, 'Page', [('old', 'new')], texts('old old old'))
+
+    assert site.edits[0]['text'] == 'new old old'
+
+
+def test_already_anchored_page_is_not_saved():
+    site = FakeSite()
+
+    assert not update_page(site, 'Page', [('old', 'new')], texts('new text'))
+    assert site.edits == []
+
+
+def test_edit_passes_conflict_timestamps():
+    site = FakeSite()
+
+    update_page(site, 'Page', [('old', 'new')], texts('old'))
+
+    assert site.edits[0]['basetimestamp'] == '2026-01-01T00:00:00Z'
+    assert site.edits[0]['starttimestamp'] == '2026-01-02T00:00:00Z'
+
+
+def test_failed_edit_is_not_reported_as_updated():
+    site = FakeSite(result='Failure')
+
+    assert not update_page(site, 'Page', [('old', 'new')], texts('old'))
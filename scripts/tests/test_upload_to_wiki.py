@@ -0,0 +1,14 @@
+"""Tests for WikiUploader's unchanged-page skip."""
+
+import hashlib
+
+from upload_to_wiki import WikiUploader
+
+
+def test_crlf_content_matching_the_live_revision_is_skipped():
+    uploader = WikiUploader('http://localhost:8082')
+    # The wiki stores \n line endings without trailing whitespace
+    remote_sha1 = hashlib.sha1(b'line one\nline two').hexdigest()
+
+    assert uploader.upload_page('Page', 'line one\r\nline two\r\n', remote_sha1=remote_sha1)
+    assert uploader.stats['skipped'] == 1
@@ -0,0 +1,81 @@
+"""Tests for MigrationValidator's on-disk page existence cache."""
+
+import json
+import time
+
+import pytest
+
+import validate_migration
+from validate_migration import MigrationValidator
+
+WIKI = 'http://localhost:8082'
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / 'page_exists.json'
+    monkeypatch.setattr(validate_migration, 'CACHE_FILE', path)
+    return path
+
+
+def test_load_keeps_unexpired_existing_pages(cache_file):
+    now = time.time()
+    cache_file.write_text(json.dumps({
+        WIKI: {'Fresh': [True, now - 10], 'Expired': [True, now - 7200]},
+        'http://other': {'Elsewhere': [True, now]},
+    }))
+
+    validator = MigrationValidator(wiki_url=WIKI, cache_ttl=3600)
+
+    assert validator.wiki_pages == {'Fresh'}
+
+
+def test_load_ignores_cached_misses(cache_file):
+    cache_file.write_text(json.dumps({WIKI: {'Gone': [False, time.time()]}}))
+
+    validator = MigrationValidator(wiki_url=WIKI)
+
+    assert validator.missing_pages == set()
+
+
+def test_save_writes_only_existing_pages_and_keeps_other_wikis(cache_file):
+    cache_file.write_text(json.dumps({'http://other': {'Elsewhere': [True, 1.0]}}))
+    validator = MigrationValidator(wiki_url=WIKI)
+    validator.wiki_pages.add('Here')
+    validator.missing_pages.add('Gone')
+
+    validator.close()
+
+    cache = json.loads(cache_file.read_text())
+    assert cache['http://other'] == {'Elsewhere': [True, 1.0]}
+    assert list(cache[WIKI]) == ['Here']
+
+
+def test_cached_check_time_survives_a_resave(cache_file):
+    checked_at = time.time() - 100
+    cache_file.write_text(json.dumps({WIKI: {'Page': [True, checked_at]}}))
+
+    MigrationValidator(wiki_url=WIKI).close()
+
+    assert json.loads(cache_file.read_text())[WIKI]['Page'] == [True, checked_at]
+
+
+def test_batch_without_query_result_is_not_recorded(cache_file):
+    class Response:
+        def json(self):
+            return {'error': {'code': 'maxlag', 'info': 'Waiting for a database server'}}
+
+    class Session:
+        def get(self, url, params=None, timeout=None):
+            return Response()
+
+        def close(self):
+            pass
+
+    validator = MigrationValidator(wiki_url=WIKI)
+    validator._session = Session()
+
+    validator._bulk_check_pages(['A', 'B'])
+
+    assert validator.missing_pages == set()
+    assert validator.check_wiki_page_exists('A')
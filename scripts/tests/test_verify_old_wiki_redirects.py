@@ -0,0 +1,235 @@
+"""Tests for verify_old_wiki_redirects."""
+
+import re
+
+import pytest
+
+import verify_old_wiki_redirects
+from verify_old_wiki_redirects import (
+    PageCache, RateLimiter, ResolvedPage, _fetch_batch, _link_title, _same_title, _title_key,
+    content_links,
+)
+
+
+@pytest.mark.parametrize('title, key', [
+    ('Getting_Started/Docker_Installation', 'Getting Started/Docker Installation'),
+    ('Getting Started/Docker Installation', 'Getting Started/Docker Installation'),
+    ('  Padded_Title ', 'Padded Title'),
+    ('Plain', 'Plain'),
+])
+def test_title_key_treats_underscores_as_spaces(title, key):
+    assert _title_key(title) == key
+
+
+@pytest.mark.parametrize('a, b', [
+    ('Security/Sql_Server', 'Security/Sql Server'),
+    ('security/Sql_Server', 'Security/Sql_Server'),  # First letter is case-insensitive
+    ('Event_Scripts', ' Event Scripts'),
+])
+def test_same_title(a, b):
+    assert _same_title(a, b)
+
+
+@pytest.mark.parametrize('a, b', [
+    ('Security/sql_Server', 'Security/Sql_Server'),  # Only the first letter folds
+    ('Event_Scripts', 'Event_Script'),
+])
+def test_different_titles(a, b):
+    assert not _same_title(a, b)
+
+
+def test_link_title_drops_anchor():
+    assert _link_title('Page_Name#Section') == 'Page_Name'
+    assert _link_title('#Section') == ''
+
+
+def test_content_links_skips_namespaces_and_anchors():
+    links = ['Page', 'Category:Docs', 'File:x.png', ':Category:Docs', '#Top', 'Other#Part']
+    assert content_links(links) == ['Page', 'Other#Part']
+
+
+_RE_REDIRECT = re.compile(r'#REDIRECT \[\[([^\]]+)\]\]')
+
+
+class FakeSite:
+    """Answers action=query like MediaWiki (formatversion 1) from {title: (lastrevid, text)}."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    @staticmethod
+    def normalize(title):
+        title = title.replace('_', ' ').strip()
+        return title[:1].upper() + title[1:]
+
+    def api(self, action, **params):
+        assert action == 'query'
+        self.calls.append(params)
+        props = params.get('prop', '').split('|')
+        query = {'pages': {}}
+        for i, asked in enumerate(params['titles'].split('|')):
+            title = self.normalize(asked)
+            if title != asked:
+                query.setdefault('normalized', []).append({'from': asked, 'to': title})
+            seen = set()
+            while params.get('redirects') and title in self.pages and title not in seen:
+                match = _RE_REDIRECT.match(self.pages[title][1])
+                if not match:
+                    break
+                seen.add(title)
+                target, _, fragment = match.group(1).partition('#')
+                redirect = {'from': title, 'to': self.normalize(target)}
+                if fragment:
+                    redirect['tofragment'] = fragment
+                query.setdefault('redirects', []).append(redirect)
+                title = redirect['to']
+            if title not in self.pages:
+                query['pages'][str(-1 - i)] = {'title': title, 'missing': ''}
+                continue
+            lastrevid, text = self.pages[title]
+            page = {'title': title}
+            if 'info' in props:
+                page.update(lastrevid=lastrevid, length=len(text.encode('utf-8')))
+            if 'revisions' in props:
+                page['revisions'] = [{'slots': {'main': {'*': text}}}]
+            query['pages'][str(lastrevid)] = page
+        return {'query': query}
+
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(verify_old_wiki_redirects, '_query_limiter', RateLimiter(1e6))
+
+
+def test_fetch_batch_keys_results_by_the_requested_titles():
+    site = FakeSite({'Getting Started': (1, 'Welcome')})
+
+    pages = _fetch_batch(site, ['getting_Started', 'Not_There'])
+
+    assert pages == {
+        'getting_Started': ResolvedPage(None, 'Welcome', len('Welcome')),
+        'Not_There': ResolvedPage(None, None, None),
+    }
+    assert len(site.calls) == 1
+
+
+def test_fetch_batch_follows_redirects_to_the_final_page():
+    site = FakeSite({
+        'Old': (1, '#REDIRECT [[New_Page#Setup]]'),
+        'New Page': (2, 'Target text'),
+        'Hop': (3, '#REDIRECT [[Middle]]'),
+        'Middle': (4, '#REDIRECT [[New Page]]'),
+        'Dangling': (5, '#REDIRECT [[Gone]]'),
+        'Plain': (6, 'Not a redirect'),
+    })
+
+    pages = _fetch_batch(site, ['Old', 'Hop', 'Dangling', 'Plain'], follow_redirects=True)
+
+    # The fragment is kept on the first hop's target; the text is the final page's
+    assert pages['Old'] == ResolvedPage('New Page#Setup', 'Target text', len('Target text'))
+    # Double redirect: first hop reported, content from the end of the chain
+    assert pages['Hop'] == ResolvedPage('Middle', 'Target text', len('Target text'))
+    assert pages['Dangling'] == ResolvedPage('Gone', None, None)
+    assert pages['Plain'] == ResolvedPage(None, 'Not a redirect', len('Not a redirect'))
+    assert site.calls[0]['redirects'] == 1
+
+
+def test_fetch_batch_without_content_asks_only_for_info():
+    site = FakeSite({'Old': (1, '#REDIRECT [[Tiny]]'), 'Tiny': (2, 'abcd')})
+
+    pages = _fetch_batch(site, ['Old', 'Missing'], follow_redirects=True, content=False)
+
+    assert pages['Old'] == ResolvedPage('Tiny', '', 4)
+    assert pages['Missing'] == ResolvedPage(None, None, None)
+    assert site.calls[0]['prop'] == 'info'
+
+
+class SplitSite(FakeSite):
+    """Returns a content query in two continuations: page info first, revisions second."""
+
+    def api(self, action, **params):
+        data = super().api(action, **params)
+        if 'revisions' not in params.get('prop', ''):
+            return data
+        continued = 'rvcontinue' in params
+        for page in data['query']['pages'].values():
+            for key in (('lastrevid', 'length') if continued else ('revisions',)):
+                page.pop(key, None)
+        if not continued:
+            data['continue'] = {'rvcontinue': '1|2', 'continue': '||'}
+        return data
+
+
+def test_fetch_batch_merges_info_and_revisions_across_continuations():
+    site = SplitSite({'Page': (7, 'Full text')})
+
+    pages = _fetch_batch(site, ['Page'])
+
+    assert pages['Page'] == ResolvedPage(None, 'Full text', len('Full text'))
+    assert len(site.calls) == 2
+    assert site.calls[1]['rvcontinue'] == '1|2'
+
+
+def test_fetch_batch_reuses_cached_text_at_the_same_lastrevid():
+    site = FakeSite({'Same': (1, 'live same'), 'Edited': (5, 'live edited')})
+    cache = PageCache('http://wiki', persistent=True)
+    cache.saved.update({'Same': (1, 'cached same'), 'Edited': (4, 'cached edited')})
+
+    pages = _fetch_batch(site, ['Same', 'Edited'], cache)
+
+    assert pages['Same'].text == 'cached same'
+    assert pages['Edited'].text == 'live edited'
+    # An info query for every title, then content only for the changed page
+    assert [call['prop'] for call in site.calls] == ['info', 'info|revisions']
+    assert site.calls[1]['titles'] == 'Edited'
+
+
+def test_fetch_batch_with_empty_cache_sends_one_content_query():
+    site = FakeSite({'Page': (3, 'text')})
+    cache = PageCache('http://wiki', persistent=True)
+
+    _fetch_batch(site, ['Page'], cache)
+
+    assert [call['prop'] for call in site.calls] == ['info|revisions']
+
+
+def test_page_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(verify_old_wiki_redirects, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(verify_old_wiki_redirects, 'PAGE_CACHE', tmp_path / 'verify.sqlite')
+    site = FakeSite({'Page': (3, 'text')})
+    cache = PageCache('http://wiki')
+    _fetch_batch(site, ['Page'], cache)
+    cache.save()
+
+    reloaded = PageCache('http://wiki')
+    reloaded.load()
+    other_wiki = PageCache('http://other')
+    other_wiki.load()
+
+    assert reloaded.saved == {'Page': (3, 'text')}
+    assert other_wiki.saved == {}
+
+
+def test_non_persistent_cache_stores_nothing(tmp_path, monkeypatch):
+    monkeypatch.setattr(verify_old_wiki_redirects, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(verify_old_wiki_redirects, 'PAGE_CACHE', tmp_path / 'verify.sqlite')
+    cache = PageCache('http://wiki', persistent=False)
+    _fetch_batch(FakeSite({'Page': (3, 'text')}), ['Page'], cache)
+    cache.save()
+
+    assert not (tmp_path / 'verify.sqlite').exists()
+
+
+def test_connect_wiki_keeps_mwclient_user_agent(monkeypatch):
+    monkeypatch.setattr(verify_old_wiki_redirects.mwclient.Site, 'site_init', lambda self: None)
+
+    site = verify_old_wiki_redirects.connect_wiki('https://wiki.example/w/', pool_size=16)
+
+    assert 'mwclient' in site.connection.headers['User-Agent']
+    for prefix in ('http://', 'https://'):
+        adapter = site.connection.get_adapter(prefix + 'wiki.example/')
+        assert adapter._pool_maxsize == 16
+        assert 429 in adapter.max_retries.status_forcelist
+    assert site.max_lag == str(verify_old_wiki_redirects.MAX_LAG)
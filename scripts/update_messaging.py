@@ -11,6 +11,9 @@ Replaces outdated messaging with the golden anchor statements:
           identity passthrough."
 """
 
+import re
+from typing import NamedTuple, Optional
+
 import mwclient
 
 ANCHOR_SHORT = (
@@ -26,6 +29,18 @@ ANCHOR_LONG = (
 
 SUMMARY = "Update DreamFactory positioning to golden anchor messaging"
 
+# Pages touched by main(), prefetched in a single query
+PAGES = [
+    "Introduction",
+    "Getting Started/Installing Dreamfactory",
+    "Architecture FAQ",
+    "Introducing Rest Dreamfactory",
+    "Security/Security Faq",
+    "System Settings/01 System Api Brief",
+    "GDPR API Gateway",
+    "Sql Server",
+]
+
 
 def connect():
     site = mwclient.Site("localhost:8082", path="/", scheme="http")
@@ -33,27 +48,88 @@ def connect():
     return site
 
 
-def update_page(site, name, replacements):
-    """Apply a list of (old, new) string replacements to a wiki page."""
-    page = site.pages[name]
-    text = page.text()
+class PageText(NamedTuple):
+    """A page's wikitext as fetched, with the timestamps an edit conflict check needs."""
+    text: str
+    basetimestamp: Optional[str]  # Timestamp of the fetched revision
+    starttimestamp: Optional[str]  # Server time of the fetch
+
+
+def fetch_texts(site, names):
+    """Fetch the current wikitext of several pages in one API query; missing pages are omitted."""
+    data = site.api('query', prop='revisions', rvprop='content|timestamp', rvslots='main',
+                    curtimestamp=1, titles='|'.join(names))
+    query = data.get('query', {})
+    texts = {}
+    for page in query.get('pages', {}).values():
+        revisions = page.get('revisions')
+        if revisions:
+            rev = revisions[0]
+            texts[page['title']] = PageText(rev['slots']['main']['*'], rev.get('timestamp'),
+                                            data.get('curtimestamp'))
+    # Key by the names we asked for, not the API's normalized titles
+    for norm in query.get('normalized', []):
+        if norm['to'] in texts:
+            texts[norm['from']] = texts[norm['to']]
+    return texts
+
+
+def update_page(site, name, replacements, texts):
+    """Apply a list of (old, new) string replacements to a wiki page.
+
+    ``texts`` holds the prefetched page text (see fetch_texts); the save is a
+    direct action=edit call using mwclient's cached edit token. Its base and
+    start timestamps make the wiki reject the save if the page was edited
+    after the fetch, instead of silently overwriting that edit.
+    """
+    page = texts.get(name, PageText('', None, None))
+    text = page.text
     original = text
+    # A previous run already applied everything: stay read-only, no warnings
+    if text and all(new in text for _, new in replacements):
+        print(f"  SKIP {name} (already anchored)")
+        return False
+    mapping = {}
     for old, new in replacements:
         if old not in text:
             print(f"  WARNING: Expected text not found in {name}:")
             print(f"    {old[:80]}...")
             continue
-        text = text.replace(old, new, 1)
+        mapping[old] = new
+    if mapping:
+        # One scan for all anchors; longest first so an anchor never loses to
+        # its own prefix, and only the first occurrence of each is replaced
+        pattern = re.compile('|'.join(map(re.escape, sorted(mapping, key=len, reverse=True))))
+        done = set()
+
+        def swap(match):
+            old = match.group(0)
+            if old in done:
+                return old
+            done.add(old)
+            return mapping[old]
+
+        text = pattern.sub(swap, text)
     if text == original:
         print(f"  SKIP {name} (no changes)")
         return False
-    page.save(text, summary=SUMMARY)
+    try:
+        result = site.api('edit', title=name, text=text, summary=SUMMARY,
+                          basetimestamp=page.basetimestamp,
+                          starttimestamp=page.starttimestamp,
+                          token=site.get_token('edit')).get('edit', {})
+        if result.get('result') != 'Success':
+            raise mwclient.errors.EditError(name, result)
+    except mwclient.errors.MwClientError as e:
+        print(f"  FAILED {name}: {e}")
+        return False
     print(f"  UPDATED {name}")
     return True
 
 
 def main():
     site = connect()
+    texts = fetch_texts(site, PAGES)
     updated = 0
 
     # ── Introduction ──
@@ -67,7 +143,7 @@ def main():
             "DreamFactory is an open-source REST API platform that automatically generates secure, fully documented APIs for any data source in minutes. Whether you're connecting to databases, external services, or file systems, DreamFactory eliminates the need to write backend code.",
             f"{ANCHOR_LONG} Generate secure, fully documented REST APIs for any database, external service, or file system in minutes — without writing backend code."
         ),
-    ])
+    ], texts)
 
     # ── Getting Started/Installing Dreamfactory ──
     print("\n2. Getting Started/Installing Dreamfactory")
@@ -76,7 +152,7 @@ def main():
             "DreamFactory is a powerful open-source REST API platform that allows you to quickly build and deploy secure and scalable applications. Whether you are running Linux, Windows, or prefer using Docker, we've got you covered.",
             f"{ANCHOR_SHORT} Whether you are running Linux, Windows, or prefer using Docker, we've got you covered."
         ),
-    ])
+    ], texts)
 
     # ── Architecture FAQ ──
     print("\n3. Architecture FAQ")
@@ -85,7 +161,7 @@ def main():
             "DreamFactory is an open source REST API backend that provides RESTful services for building mobile, web, and IoT applications. In technical terms, DreamFactory is a runtime application that runs on a web server similar to a website running on a traditional LAMP server.",
             f"{ANCHOR_SHORT} In technical terms, DreamFactory is a runtime application that runs on a web server similar to a website running on a traditional LAMP server, exposing RESTful services for building enterprise, mobile, web, and IoT applications."
         ),
-    ])
+    ], texts)
 
     # ── Introducing Rest Dreamfactory ──
     print("\n4. Introducing Rest Dreamfactory")
@@ -94,7 +170,7 @@ def main():
             "This chapter introduces you to DreamFactory, an automated REST API generation, integration, and management platform. You can use DreamFactory to generate REST APIs for hundreds of data sources, including MySQL and Microsoft SQL Server databases, file systems including Amazon S3, and e-mail delivery providers like Mandrill. You can also integrate third-party APIs, including all of the services mentioned above. This opens up a whole new world of possibilities in terms of building sophisticated workflows. But before we jump into this introduction, some readers might be wondering what a REST API is in the first place, let alone why so many organizations rely on REST for their API implementations.",
             f"This chapter introduces you to DreamFactory. {ANCHOR_LONG} You can use DreamFactory to generate governed REST APIs for hundreds of data sources, including MySQL and Microsoft SQL Server databases, file systems including Amazon S3, and e-mail delivery providers like Mandrill. You can also integrate third-party APIs, including all of the services mentioned above. This opens up a whole new world of possibilities in terms of building sophisticated workflows. But before we jump into this introduction, some readers might be wondering what a REST API is in the first place, let alone why so many organizations rely on REST for their API implementations."
         ),
-    ])
+    ], texts)
 
     # ── Security/Security Faq ──
     print("\n5. Security/Security Faq")
@@ -109,7 +185,7 @@ def main():
             "* DreamFactory is an on-premise platform for instantly creating and managing APIs, currently used across the healthcare, finance, telecommunications, banking, government, & manufacturing industries.",
             f"* {ANCHOR_SHORT} DreamFactory is currently used across the healthcare, finance, telecommunications, banking, government, & manufacturing industries."
         ),
-    ])
+    ], texts)
 
     # ── System Settings/01 System Api Brief ──
     print("\n6. System Settings/01 System Api Brief")
@@ -118,7 +194,7 @@ def main():
             "DreamFactory is a '''headless API platform''', meaning that everything you can do through the web-based administration console can also be accomplished programmatically through REST API calls.",
             f"DreamFactory is a '''headless enterprise data access platform''', meaning that everything you can do through the web-based administration console can also be accomplished programmatically through REST API calls."
         ),
-    ])
+    ], texts)
 
     # ── GDPR API Gateway ──
     print("\n7. GDPR API Gateway")
@@ -136,7 +212,7 @@ def main():
             "Progressive organizations are re-architecting their infrastructure with API platforms to get ahead of the competition. By taking this approach, enterprises have been able to share their data assets safely with any data consumer they need to support - whether to turbo charge new mobile and web app ecosystems, integrate cross-enterprise data, or create new business opportunities with partners & customers.\n\nNow, with GDPR, there is an emerging and mission critical consumer of enterprise data that an API platform can support: the Data Protection Officer.",
             "Progressive organizations are re-architecting their infrastructure with enterprise data access platforms to get ahead of the competition. By taking this approach, enterprises have been able to share their data assets safely with any data consumer they need to support — whether to turbo charge new mobile and web app ecosystems, integrate cross-enterprise data, enable on-prem LLMs, or create new business opportunities with partners & customers.\n\nNow, with GDPR, there is an emerging and mission critical consumer of enterprise data that a governed data access platform can support: the Data Protection Officer."
         ),
-    ])
+    ], texts)
 
     # ── Sql Server ──
     print("\n8. Sql Server")
@@ -149,10 +225,10 @@ def main():
             "'''When to use each:''' - '''DreamFactory''': When you need a comprehensive API management platform with security, governance, and multi-source support",
             "'''When to use each:''' - '''DreamFactory''': When you need a secure, self-hosted enterprise data access platform with governed API access, role-based access control, and multi-source support"
         ),
-    ])
+    ], texts)
 
     print(f"\n{'='*50}")
-    print(f"Done. Updated {updated}/8 pages.")
+    print(f"Done. Updated {updated}/{len(PAGES)} pages.")
     print(f"{'='*50}")
 
 
@@ -10,32 +10,91 @@ Usage:
 """
 
 import argparse
+import itertools
+import json
 import os
 import re
 from datetime import datetime
+from pathlib import Path
 
 import requests
 import mwclient
 
 GITHUB_API = "https://api.github.com/repos/dreamfactorysoftware/dreamfactory/releases"
+RELEASES_TEMPLATE = "Template:DreamFactory Releases"
+
+# Last GitHub response + ETag; a 304 revalidation is free of rate limit
+CACHE_FILE = Path.home() / ".cache" / "df-wiki" / "releases.json"
+
+# Shared keep-alive session for GitHub calls (also reused when
+# upload_main_page imports fetch_releases). Prefers an HTTP/2 httpx client
+# when httpx and h2 are installed. The two clients differ: httpx only
+# follows redirects (e.g. after a repo rename) when told to, and its errors
+# are httpx.HTTPError rather than requests.RequestException, so code that
+# handles fetch failures catches Exception (as upload_main_page does). The
+# get()/status_code/headers/json()/raise_for_status() calls used below
+# behave the same on both.
+try:
+    import httpx
+    SESSION = httpx.Client(http2=True, follow_redirects=True)
+except ImportError:
+    SESSION = requests.Session()
+
+# Markdown cleanup for release summaries
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_FMT_RE = re.compile(r'[*_`]')
+
+# One {{GitHubRelease}} call per release (braces doubled for str.format)
+_TPL = "{{{{GitHubRelease|version={version}|date={date}|notes={notes}|url={url}}}}}"
+
+
+def _load_cache(count):
+    """Return the cached {etag, body} for this page size, or None."""
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cache.get("per_page") != count or not cache.get("etag"):
+        return None
+    return cache
+
+
+def _save_cache(count, etag, body):
+    """Persist the GitHub response; a failed write only costs the next revalidation."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps({"per_page": count, "etag": etag, "body": body}),
+                              encoding="utf-8")
+    except OSError:
+        pass
 
 
 def fetch_releases(count=5):
-    """Fetch recent releases from GitHub."""
-    resp = requests.get(GITHUB_API, params={"per_page": count}, timeout=15)
-    resp.raise_for_status()
+    """Fetch recent releases from GitHub (conditional GET against the local cache)."""
+    cache = _load_cache(count)
+    headers = {"Accept": "application/vnd.github+json"}
+    if cache:
+        headers["If-None-Match"] = cache["etag"]
+    resp = SESSION.get(GITHUB_API, params={"per_page": count}, headers=headers, timeout=15)
+    if resp.status_code == 304 and cache:
+        data = cache["body"]
+    else:
+        resp.raise_for_status()
+        data = resp.json()
+        if resp.headers.get("ETag"):
+            _save_cache(count, resp.headers["ETag"], data)
+
     releases = []
-    for r in resp.json():
+    for r in data:
         body = r.get("body", "") or ""
-        # Take first 2-3 meaningful lines
-        lines = [l.strip() for l in body.splitlines() if l.strip() and not l.strip().startswith('#')]
-        summary = " ".join(lines[:3])
+        # Take first 2-3 meaningful lines (stops scanning once it has them)
+        lines = (l for l in map(str.strip, body.splitlines()) if l and not l.startswith('#'))
+        summary = " ".join(itertools.islice(lines, 3))
         # Truncate long summaries
         if len(summary) > 200:
             summary = summary[:197] + "..."
         # Clean markdown formatting for wiki
-        summary = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', summary)
-        summary = re.sub(r'[*_`]', '', summary)
+        summary = _FMT_RE.sub('', _LINK_RE.sub(r'\1', summary))
 
         date_str = r.get("published_at", "")
         if date_str:
@@ -59,24 +118,27 @@ def format_releases(releases):
         '<noinclude>Container for DreamFactory release entries. '
         'Updated automatically by update_releases.py.</noinclude><includeonly>'
     ]
-    for r in releases:
-        parts.append(
-            "{{GitHubRelease"
-            f"|version={r['version']}"
-            f"|date={r['date']}"
-            f"|notes={r['notes']}"
-            f"|url={r['url']}"
-            "}}"
-        )
+    parts.extend(_TPL.format_map(r) for r in releases)
     parts.append('</includeonly>')
     return "\n".join(parts)
 
 
+def save_releases(site, content):
+    """Save the releases template on an existing Site; False if it was already current."""
+    page = site.pages[RELEASES_TEMPLATE]
+    if page.text() == content:
+        print(f"  {RELEASES_TEMPLATE} already up to date")
+        return False
+    page.save(content, summary="Update GitHub releases (automated)")
+    print(f"  Updated {RELEASES_TEMPLATE}")
+    return True
+
+
 def upload_releases(wiki_host, wiki_path, scheme, content, dry_run=False,
                     username=None, password=None):
     """Upload formatted releases to the wiki."""
     if dry_run:
-        print("[DRY RUN] Would upload Template:DreamFactory Releases")
+        print(f"[DRY RUN] Would upload {RELEASES_TEMPLATE}")
         print(content)
         return True
 
@@ -86,9 +148,9 @@ def upload_releases(wiki_host, wiki_path, scheme, content, dry_run=False,
         print(f"  Logged in as: {username}")
     else:
         site.force_login = False
-    page = site.pages["Template:DreamFactory Releases"]
-    page.save(content, summary="Update GitHub releases (automated)")
-    print("  Updated Template:DreamFactory Releases")
+    # Unchanged releases: skip the Main Page purge too
+    if not save_releases(site, content):
+        return True
 
     # Purge Main Page cache so the transclusion updates immediately
     main_page = site.pages["Main Page"]
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """Upload available guide images to the staging MediaWiki wiki."""
 
+import hashlib
+import mmap
 import os
-import sys
 import re
-import glob
-import mimetypes
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 import mwclient
 
@@ -17,30 +17,165 @@ CONVERTED_DIR = os.path.join(os.path.dirname(__file__), 'converted')
 WIKI_HOST = 'localhost:8082'
 WIKI_PATH = '/'
 WIKI_SCHEME = 'http'
+UPLOAD_WORKERS = 6  # Keep small to avoid server-side throttling
+API_BATCH_SIZE = 50  # Max titles per API query for non-bot accounts
+HASH_CHUNK_SIZE = 1024 * 1024
+PARALLEL_SCAN_MIN_FILES = 200  # Below this, process startup costs more than it saves
+SCAN_CHUNK_SIZE = 64  # .wiki files per worker task
+
+_FILE_RE = re.compile(rb'\[\[File:([^\]|]+)')
+
+
+def _iter_files(top, skip_hidden=False):
+    """Yield a DirEntry for every file under top, in os.walk's top-down order."""
+    stack = [top]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if skip_hidden and entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _iter_wiki_files(converted_dir):
+    """Yield paths of .wiki files under converted_dir (hidden entries skipped, like glob)."""
+    for entry in _iter_files(converted_dir, skip_hidden=True):
+        if entry.name.endswith('.wiki'):
+            yield entry.path
 
 
 def find_all_images(images_dir):
     """Build a dict mapping bare filename -> full path for all images."""
     result = {}
-    for root, dirs, files in os.walk(images_dir):
-        for f in files:
-            full_path = os.path.join(root, f)
-            # Store by bare filename (lowercase for case-insensitive matching)
-            result[f.lower()] = full_path
+    # Top-down order matters: the same file as os.walk wins on duplicate names
+    for entry in _iter_files(images_dir):
+        # Store by bare filename (lowercase for case-insensitive matching)
+        result[entry.name.lower()] = entry.path
     return result
 
 
+def _scan_files(paths):
+    """Collect [[File:...]] names from the given .wiki files (a worker-process task)."""
+    refs = set()
+    for wiki_file in paths:
+        # The pattern is pure ASCII, so scan the raw bytes and decode only the hits
+        with open(wiki_file, 'rb') as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                continue  # mmap can't map an empty file
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for match in _FILE_RE.finditer(data):
+                    refs.add(match.group(1).decode('utf-8'))
+    return refs
+
+
 def find_referenced_images(converted_dir):
     """Extract all unique [[File:...]] references from .wiki files."""
-    pattern = re.compile(r'\[\[File:([^]|]+)')
+    files = list(_iter_wiki_files(converted_dir))
+    if len(files) < PARALLEL_SCAN_MIN_FILES:
+        return _scan_files(files)
+
     refs = set()
-    for wiki_file in glob.glob(os.path.join(converted_dir, '**', '*.wiki'), recursive=True):
-        with open(wiki_file, 'r') as fh:
-            for match in pattern.finditer(fh.read()):
-                refs.add(match.group(1))
+    chunks = [files[i:i + SCAN_CHUNK_SIZE] for i in range(0, len(files), SCAN_CHUNK_SIZE)]
+    with ProcessPoolExecutor() as executor:
+        for chunk_refs in executor.map(_scan_files, chunks):
+            refs |= chunk_refs
     return refs
 
 
+def file_sha1(path):
+    """SHA-1 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fetch_remote_sha1s(site, wiki_names):
+    """Return {wiki_name: sha1} for File pages already on the wiki (batched imageinfo).
+
+    A page that exists without a file of its own (e.g. a file redirect) maps to ''.
+    """
+    names = list(wiki_names)
+    result = {}
+    for i in range(0, len(names), API_BATCH_SIZE):
+        batch = names[i:i + API_BATCH_SIZE]
+        titles = {f'File:{name}': name for name in batch}
+        data = site.api('query', prop='imageinfo', iiprop='sha1', titles='|'.join(titles))
+        query = data.get('query', {})
+        # Map the API's normalized titles back to our names
+        for norm in query.get('normalized', []):
+            if norm['from'] in titles:
+                titles[norm['to']] = titles[norm['from']]
+        for page in query.get('pages', {}).values():
+            if 'missing' in page or 'invalid' in page or page.get('title') not in titles:
+                continue
+            info = page.get('imageinfo')
+            result[titles[page['title']]] = info[0].get('sha1', '') if info else ''
+    return result
+
+
+def _file_title(name):
+    """A file name as MediaWiki stores it: underscores as spaces, first letter uppercase."""
+    name = name.replace('_', ' ').strip()
+    return name[:1].upper() + name[1:]
+
+
+def split_duplicates(to_upload, sha1s):
+    """Keep one wiki name per distinct file content in to_upload.
+
+    Removes the extra names from to_upload in place and returns
+    {alias: canonical} for them; the canonical name is the first in sort order.
+    """
+    by_sha1 = {}
+    for wiki_name in sorted(to_upload):
+        by_sha1.setdefault(sha1s[to_upload[wiki_name]], []).append(wiki_name)
+    aliases = {}
+    for canonical, *others in by_sha1.values():
+        for alias in others:
+            aliases[alias] = canonical
+            del to_upload[alias]
+    return aliases
+
+
+def _upload_one(site, wiki_name, local_path):
+    """Upload a single file. Returns (status, message) with status in
+    'uploaded' / 'error'; runs on a worker thread, so it doesn't print."""
+    # MediaWiki normalizes filenames: first letter uppercase
+    # The wiki_name from [[File:X]] is what we upload as
+    try:
+        file_size = os.path.getsize(local_path)
+        label = f"{wiki_name} ({file_size:,} bytes)"
+
+        with open(local_path, 'rb') as fh:
+            result = site.upload(
+                fh,
+                filename=wiki_name,
+                description=f'DreamFactory guide image: {wiki_name}',
+                ignore=True  # overwrite if exists
+            )
+
+        if result.get('result') == 'Success':
+            return 'uploaded', f"{label}... OK"
+        elif result.get('result') == 'Warning':
+            # Warnings like "duplicate" still succeed
+            warnings = result.get('warnings', {})
+            return 'uploaded', f"{label}... OK (warnings: {list(warnings.keys())})"
+        else:
+            return 'error', f"{label}... UNEXPECTED: {result}"
+    except Exception as e:
+        import traceback
+        return 'error', f"{wiki_name}... ERROR: {e}\n{traceback.format_exc()}"
+
+
 def main():
     images_dir = os.path.normpath(IMAGES_DIR)
     converted_dir = os.path.normpath(CONVERTED_DIR)
@@ -83,45 +218,60 @@ def main():
 
     uploaded = 0
     skipped = 0
+    redirected = 0
     errors = 0
 
-    for wiki_name, local_path in sorted(to_upload.items()):
-        # MediaWiki normalizes filenames: first letter uppercase
-        # The wiki_name from [[File:X]] is what we upload as
-        mime_type, _ = mimetypes.guess_type(local_path)
-        if not mime_type:
-            mime_type = 'application/octet-stream'
+    # Hash each local file once; identical bytes under several names are
+    # uploaded once and the other names become file redirects
+    sha1s = {path: file_sha1(path) for path in set(to_upload.values())}
+    aliases = split_duplicates(to_upload, sha1s)
+    if aliases:
+        print(f"  {len(aliases)} references are duplicates of another image")
 
-        try:
-            file_size = os.path.getsize(local_path)
-            print(f"  Uploading {wiki_name} ({file_size:,} bytes)...", end=' ')
-
-            with open(local_path, 'rb') as fh:
-                result = site.upload(
-                    fh,
-                    filename=wiki_name,
-                    description=f'DreamFactory guide image: {wiki_name}',
-                    ignore=True  # overwrite if exists
-                )
-
-            if result.get('result') == 'Success':
-                uploaded += 1
-                print("OK")
-            elif result.get('result') == 'Warning':
-                # Warnings like "duplicate" still succeed
+    # Skip files whose bytes already match the wiki's current version; the
+    # same query tells which alias names are already taken on the wiki
+    remote_sha1 = fetch_remote_sha1s(site, list(to_upload) + list(aliases))
+    for wiki_name, local_path in list(to_upload.items()):
+        if remote_sha1.get(wiki_name) == sha1s[local_path]:
+            del to_upload[wiki_name]
+            skipped += 1
+    if skipped:
+        print(f"  {skipped} files unchanged on the wiki, skipping")
+
+    # Uploads are network-bound multipart POSTs; counters are only
+    # touched here on the main thread
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(_upload_one, site, wiki_name, local_path): wiki_name
+            for wiki_name, local_path in sorted(to_upload.items())
+        }
+        failed = set()
+        for future in as_completed(futures):
+            status, message = future.result()
+            print(f"  Uploading {message}")
+            if status == 'uploaded':
                 uploaded += 1
-                warnings = result.get('warnings', {})
-                print(f"OK (warnings: {list(warnings.keys())})")
             else:
                 errors += 1
-                print(f"UNEXPECTED: {result}")
+                failed.add(futures[future])
+
+    for alias, canonical in sorted(aliases.items()):
+        if canonical in failed or _file_title(alias) == _file_title(canonical):
+            continue  # Nothing to point at, or already the same title on the wiki
+        if alias in remote_sha1:
+            continue  # A real file (never clobber it) or the redirect from an earlier run
+        try:
+            site.pages[f'File:{alias}'].save(
+                f'#REDIRECT [[File:{canonical}]]',
+                summary=f'Duplicate of {canonical}'
+            )
+            print(f"  Redirected {alias} -> {canonical}")
+            redirected += 1
         except Exception as e:
+            print(f"  Redirecting {alias}... ERROR: {e}")
             errors += 1
-            import traceback
-            print(f"ERROR: {e}")
-            traceback.print_exc()
 
-    print(f"\nDone: {uploaded} uploaded, {skipped} skipped, {errors} errors")
+    print(f"\nDone: {uploaded} uploaded, {skipped} skipped, {redirected} redirected, {errors} errors")
     print(f"Missing images not in repo: {len(missing)}")
 
 
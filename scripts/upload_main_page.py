@@ -14,10 +14,13 @@ Usage:
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import mwclient
 
+from update_messaging import fetch_texts
+
 SCRIPT_DIR = Path(__file__).parent
 TEMPLATE_DIR = SCRIPT_DIR / "main_page_templates"
 
@@ -32,6 +35,7 @@ TEMPLATES = {
 }
 
 CSS_MARKER = "/* DreamFactory Main Page Styles */"
+CSS_PAGE = "MediaWiki:Common.css"
 
 
 def connect(wiki_url):
@@ -48,10 +52,31 @@ def connect(wiki_url):
     return site
 
 
+def save_text(site, title, text, summary, fetched=None):
+    """Save a page with a direct action=edit call; raises unless the wiki reports Success.
+
+    ``fetched`` is the PageText the new text was based on: its timestamps turn
+    an edit made since the fetch into an edit conflict instead of silently
+    overwriting it. Without it the page must not exist yet (createonly).
+    """
+    if fetched is None:
+        conflict_check = {"createonly": 1}
+    else:
+        conflict_check = {"basetimestamp": fetched.basetimestamp,
+                          "starttimestamp": fetched.starttimestamp}
+    result = site.api("edit", title=title, text=text, summary=summary,
+                      token=site.get_token("edit"), **conflict_check).get("edit", {})
+    if result.get("result") != "Success":
+        raise mwclient.errors.EditError(title, result)
+
+
 def upload_templates(site, dry_run=False):
     """Upload all template files to the wiki."""
     print("\n=== Uploading Templates ===")
     count = 0
+    unchanged = 0
+    # Current text of all templates in one query, so reruns only save real changes
+    current = {} if dry_run else fetch_texts(site, TEMPLATES.values())
     for filename, page_name in TEMPLATES.items():
         filepath = TEMPLATE_DIR / filename
         if not filepath.exists():
@@ -61,39 +86,55 @@ def upload_templates(site, dry_run=False):
         content = filepath.read_text(encoding="utf-8")
         if dry_run:
             print(f"  [DRY RUN] Would upload {page_name}")
+        elif page_name in current and current[page_name].text.rstrip() == content.rstrip():
+            # MediaWiki strips trailing whitespace on save, so compare without it
+            print(f"  Unchanged: {page_name}")
+            unchanged += 1
         else:
-            page = site.pages[page_name]
-            page.save(content, summary="Main Page template (automated)")
-            status = "Updated" if page.exists else "Created"
+            try:
+                save_text(site, page_name, content, "Main Page template (automated)",
+                          current.get(page_name))
+            except mwclient.errors.MwClientError as e:
+                print(f"  FAILED {page_name}: {e}")
+                continue
+            status = "Updated" if page_name in current else "Created"
             print(f"  {status}: {page_name}")
         count += 1
-    print(f"  Templates processed: {count}/{len(TEMPLATES)}")
+    print(f"  Templates processed: {count}/{len(TEMPLATES)} ({unchanged} unchanged)")
     return count
 
 
-def update_releases(site, dry_run=False):
-    """Fetch GitHub releases and update the wiki template."""
-    print("\n=== Fetching GitHub Releases ===")
+def _releases_module():
+    """Import update_releases.py, which lives next to this script."""
     try:
-        from update_releases import fetch_releases, format_releases
+        import update_releases as releases_module
     except ImportError:
         # Add script dir to path
         sys.path.insert(0, str(SCRIPT_DIR))
-        from update_releases import fetch_releases, format_releases
+        import update_releases as releases_module
+    return releases_module
+
+
+def update_releases(site, dry_run=False, pending=None):
+    """Fetch GitHub releases and update the wiki template.
+
+    ``pending`` is an optional future already running fetch_releases(5).
+    """
+    print("\n=== Fetching GitHub Releases ===")
+    releases_module = _releases_module()
 
     try:
-        releases = fetch_releases(5)
+        releases = pending.result() if pending else releases_module.fetch_releases(5)
         print(f"  Found {len(releases)} releases")
         for r in releases:
             print(f"    {r['version']} ({r['date']})")
 
-        content = format_releases(releases)
+        content = releases_module.format_releases(releases)
         if dry_run:
             print("  [DRY RUN] Would update Template:DreamFactory Releases")
         else:
-            page = site.pages["Template:DreamFactory Releases"]
-            page.save(content, summary="Update GitHub releases (automated)")
-            print("  Updated Template:DreamFactory Releases")
+            # Same Site (and cached edit token) as the rest of the run
+            releases_module.save_releases(site, content)
         return True
     except Exception as e:
         print(f"  WARNING: Could not fetch releases: {e}")
@@ -112,11 +153,12 @@ def upload_css(site, dry_run=False):
     new_css = css_file.read_text(encoding="utf-8")
 
     if dry_run:
-        print("  [DRY RUN] Would append CSS to MediaWiki:Common.css")
+        print(f"  [DRY RUN] Would append CSS to {CSS_PAGE}")
         return True
 
-    page = site.pages["MediaWiki:Common.css"]
-    existing = page.text() if page.exists else ""
+    # One query covers both existence and content
+    fetched = fetch_texts(site, [CSS_PAGE]).get(CSS_PAGE)
+    existing = fetched.text if fetched else ""
 
     if CSS_MARKER in existing:
         # Replace existing main page CSS block
@@ -135,8 +177,14 @@ def upload_css(site, dry_run=False):
     else:
         combined = new_css
 
-    page.save(combined, summary="Add/update Main Page styles (automated)")
-    print("  Updated MediaWiki:Common.css")
+    # Common.css is shared: a conflicting edit since the fetch fails the save
+    # rather than being overwritten by this read-merge-write
+    try:
+        save_text(site, CSS_PAGE, combined, "Add/update Main Page styles (automated)", fetched)
+    except mwclient.errors.MwClientError as e:
+        print(f"  FAILED {CSS_PAGE}: {e}")
+        return False
+    print(f"  Updated {CSS_PAGE}")
     return True
 
 
@@ -175,8 +223,12 @@ def main():
     site = connect(args.wiki_url)
 
     results = {}
-    results["templates"] = upload_templates(site, args.dry_run)
-    results["releases"] = update_releases(site, args.dry_run)
+    # GitHub and the wiki are different hosts: fetch releases while the
+    # templates upload, and collect them at the releases step
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(_releases_module().fetch_releases, 5)
+        results["templates"] = upload_templates(site, args.dry_run)
+        results["releases"] = update_releases(site, args.dry_run, pending)
     results["css"] = upload_css(site, args.dry_run)
     results["main_page"] = upload_main_page(site, args.dry_run)
 
@@ -9,7 +9,7 @@ Usage:
     python upload_to_wiki.py --wiki-url https://wiki.dreamfactory.com \
                               --input-dir ./converted \
                               --inventory migration_inventory.csv \
-                              [--dry-run] [--username USER] [--password PASS]
+                              [--dry-run] [--username USER] [--password PASS] [--concurrency N]
 """
 
 import os
@@ -17,8 +17,12 @@ import re
 import csv
 import argparse
 import getpass
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 
 try:
     import mwclient
@@ -26,14 +30,28 @@ except ImportError:
     print("Error: mwclient not installed. Run: pip install mwclient")
     exit(1)
 
+import requests
+
+from postprocess import DOC_PREFIXES
+from sync_to_wiki import _content_sha1
+
+
+DEFAULT_CONCURRENCY = 4  # Concurrent page edits; small to stay polite to the wiki
+API_BATCH_SIZE = 50  # Max titles per API query for non-bot accounts
+PROTECTED_CODES = ('protectedpage', 'cascadeprotected', 'protectedtitle', 'protectednamespace')
+RETRY_ATTEMPTS = 5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_MAX_DELAY = 8.0  # seconds
+
 
 class WikiUploader:
     """Handles uploading content to MediaWiki."""
 
     def __init__(self, wiki_url: str, username: str = None, password: str = None,
-                 dry_run: bool = False):
+                 dry_run: bool = False, concurrency: int = DEFAULT_CONCURRENCY):
         self.wiki_url = wiki_url
         self.dry_run = dry_run
+        self.concurrency = max(1, concurrency)
         self.site = None
         self.username = username
         self.password = password
@@ -43,6 +61,40 @@ class WikiUploader:
             'skipped': 0,
             'failed': 0
         }
+        self.retries = 0
+        # upload_page runs on worker threads during upload_directory
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str):
+        """Increment a stats counter (thread-safe)."""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _api(self, *args, **kwargs) -> Dict:
+        """site.api() with exponential backoff + jitter on throttling and transient errors.
+
+        mwclient already retries 5xx and maxlag itself; this also covers 429
+        (honouring Retry-After) and dropped connections.
+        """
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                return self.site.api(*args, **kwargs)
+            except requests.exceptions.HTTPError as e:
+                response = e.response
+                if response is None or response.status_code not in RETRY_STATUSES \
+                        or attempt == RETRY_ATTEMPTS - 1:
+                    raise
+                retry_after = response.headers.get('Retry-After', '')
+                delay = float(retry_after) if retry_after.isdigit() else None
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == RETRY_ATTEMPTS - 1:
+                    raise
+                delay = None
+            if delay is None:
+                delay = min(RETRY_MAX_DELAY, 0.5 * 2 ** attempt) + random.uniform(0, 0.5)
+            with self._stats_lock:
+                self.retries += 1
+            time.sleep(delay)
 
     def connect(self) -> bool:
         """Connect to the MediaWiki site."""
@@ -76,7 +128,35 @@ class WikiUploader:
             print(f"Error connecting to wiki: {e}")
             return False
 
-    def upload_page(self, page_name: str, content: str, summary: str = None) -> bool:
+    def page_sha1s(self, titles: Iterable[str]) -> Dict[str, str]:
+        """Map each existing title to its current revision's SHA-1 (one query per 50 titles).
+
+        Titles that don't exist are left out, so the keys double as an
+        existence check.
+        """
+        titles = list(titles)
+        sha1s = {}
+        for i in range(0, len(titles), API_BATCH_SIZE):
+            batch = titles[i:i + API_BATCH_SIZE]
+            data = self._api('query', titles='|'.join(batch), prop='revisions', rvprop='sha1')
+            query = data.get('query', {})
+            normalized = {n['from']: n['to'] for n in query.get('normalized', [])}
+            found = {
+                p['title']: (p.get('revisions') or [{}])[0].get('sha1', '')
+                for p in query.get('pages', {}).values() if 'missing' not in p
+            }
+            for t in batch:
+                title = normalized.get(t, t)
+                if title in found:
+                    sha1s[t] = found[title]
+        return sha1s
+
+    def existing_titles(self, titles: Iterable[str]) -> Set[str]:
+        """Return the subset of titles that exist."""
+        return set(self.page_sha1s(titles))
+
+    def upload_page(self, page_name: str, content: str, summary: str = None,
+                    exists: Optional[bool] = None, remote_sha1: Optional[str] = None) -> bool:
         """
         Upload a single page to the wiki.
 
@@ -84,6 +164,9 @@ class WikiUploader:
             page_name: The wiki page title
             content: The page content (MediaWiki syntax)
             summary: Edit summary
+            exists: Whether the page already exists, if known (skips a lookup)
+            remote_sha1: SHA-1 of the live revision, if known; an identical
+                page is skipped instead of re-saved
 
         Returns:
             True if successful, False otherwise
@@ -91,36 +174,50 @@ class WikiUploader:
         if not summary:
             summary = "Documentation migration from Docusaurus/Hugo"
 
+        # Each outcome is printed as one line so concurrent uploads don't interleave
         try:
-            print(f"  Uploading: {page_name}...", end=' ')
-
             if self.dry_run:
-                print("[DRY RUN - Would upload]")
-                self.stats['created'] += 1
+                print(f"  Uploading: {page_name}... [DRY RUN - Would upload]")
+                self._count('created')
                 return True
 
-            page = self.site.pages[page_name]
+            if remote_sha1 and remote_sha1 == _content_sha1(content):
+                print(f"  Uploading: {page_name}... Unchanged")
+                self._count('skipped')
+                return True
 
-            if page.exists:
-                # Page exists - update it
-                page.save(content, summary=summary + " (update)")
-                print("Updated")
-                self.stats['updated'] += 1
+            if exists is None:
+                exists = page_name in self.existing_titles([page_name])
+
+            # Direct action=edit: no per-page info query, and mwclient caches
+            # the CSRF token on the Site after the first call
+            result = self._api(
+                'edit', title=page_name, text=content, bot=1,
+                summary=summary + (" (update)" if exists else " (new)"),
+                token=self.site.get_token('edit'),
+            ).get('edit', {})
+            if result.get('result') != 'Success':
+                raise mwclient.errors.EditError(page_name, result)
+
+            if exists:
+                print(f"  Uploading: {page_name}... Updated")
+                self._count('updated')
             else:
-                # New page
-                page.save(content, summary=summary + " (new)")
-                print("Created")
-                self.stats['created'] += 1
+                print(f"  Uploading: {page_name}... Created")
+                self._count('created')
 
             return True
 
-        except mwclient.errors.ProtectedPageError:
-            print("FAILED (protected page)")
-            self.stats['failed'] += 1
+        except mwclient.errors.APIError as e:
+            if e.code in PROTECTED_CODES:
+                print(f"  Uploading: {page_name}... FAILED (protected page)")
+            else:
+                print(f"  Uploading: {page_name}... FAILED ({e})")
+            self._count('failed')
             return False
         except Exception as e:
-            print(f"FAILED ({e})")
-            self.stats['failed'] += 1
+            print(f"  Uploading: {page_name}... FAILED ({e})")
+            self._count('failed')
             return False
 
     def create_redirect(self, from_page: str, to_page: str) -> bool:
@@ -153,6 +250,17 @@ class WikiUploader:
             print(f"FAILED ({e})")
             return False
 
+    def _upload_file(self, page_name: str, wiki_file: Path, exists: Optional[bool],
+                     remote_sha1: Optional[str] = None) -> bool:
+        """Read one .wiki file and upload it (a worker-thread task)."""
+        try:
+            content = wiki_file.read_text(encoding='utf-8')
+        except Exception as e:
+            print(f"  Error reading {wiki_file}: {e}")
+            self._count('failed')
+            return False
+        return self.upload_page(page_name, content, exists=exists, remote_sha1=remote_sha1)
+
     def upload_directory(self, input_dir: str, inventory_file: str = None) -> Dict:
         """
         Upload all wiki files from a directory.
@@ -170,8 +278,12 @@ class WikiUploader:
             print(f"Error: Input directory not found: {input_dir}")
             return self.stats
 
-        # Load inventory for page name mappings if provided
-        page_mappings = {}
+        # Load inventory for page name mappings if provided. Keyed by the
+        # source path relative to the docs root with a .wiki suffix (the
+        # converted/ layout), plus the bare filename for flattened trees;
+        # first row wins
+        mapping_by_rel = {}
+        mapping_by_name = {}
         if inventory_file and Path(inventory_file).exists():
             with open(inventory_file, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
@@ -179,24 +291,27 @@ class WikiUploader:
                     source = row.get('source_path', '')
                     target = row.get('target_wiki_page', '')
                     if source and target:
-                        # Create mapping from converted filename to wiki page name
-                        wiki_file = source.replace('.md', '.wiki')
-                        page_mappings[wiki_file] = target
+                        for prefix in DOC_PREFIXES:
+                            if source.startswith(prefix):
+                                source = source[len(prefix):]
+                                break
+                        rel = Path(source).with_suffix('.wiki')
+                        mapping_by_rel.setdefault(rel.as_posix(), target)
+                        mapping_by_name.setdefault(rel.name, target)
 
         # Find all .wiki files
         wiki_files = list(input_path.rglob('*.wiki'))
         print(f"\nFound {len(wiki_files)} wiki files to upload\n")
 
+        jobs = []
         for wiki_file in wiki_files:
             rel_path = wiki_file.relative_to(input_path)
 
             # Determine page name
             # First check inventory mapping
-            page_name = None
-            for source, target in page_mappings.items():
-                if str(rel_path) in source or source in str(rel_path):
-                    page_name = target
-                    break
+            page_name = mapping_by_rel.get(rel_path.as_posix())
+            if not page_name and len(rel_path.parts) == 1:
+                page_name = mapping_by_name.get(rel_path.name)
 
             # Fall back to filename-based page name
             if not page_name:
@@ -206,13 +321,26 @@ class WikiUploader:
                     for word in page_name.replace('-', '_').split('_')
                 )
 
-            # Read content
+            jobs.append((page_name, wiki_file))
+
+        # One query per 50 pages for existence and current content hash,
+        # instead of one per page; unchanged pages are then skipped
+        remote = None
+        if not self.dry_run:
             try:
-                content = wiki_file.read_text(encoding='utf-8')
-                self.upload_page(page_name, content)
+                remote = self.page_sha1s(dict.fromkeys(name for name, _ in jobs))
             except Exception as e:
-                print(f"  Error reading {wiki_file}: {e}")
-                self.stats['failed'] += 1
+                print(f"  Warning: batch existence check failed ({e}); checking per page")
+
+        # Each edit is a blocking HTTP round-trip, so overlap them on a
+        # small pool; mwclient's Site/session is shared between threads
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(self._upload_file, page_name, wiki_file,
+                                       None if remote is None else page_name in remote,
+                                       None if remote is None else remote.get(page_name))
+                       for page_name, wiki_file in jobs]
+            for future in as_completed(futures):
+                future.result()
 
         return self.stats
 
@@ -225,8 +353,10 @@ class WikiUploader:
         print(f"  Updated: {self.stats['updated']}")
         print(f"  Skipped: {self.stats['skipped']}")
         print(f"  Failed:  {self.stats['failed']}")
+        if self.retries:
+            print(f"  Retried requests: {self.retries}")
         total = sum(self.stats.values())
-        success = self.stats['created'] + self.stats['updated']
+        success = self.stats['created'] + self.stats['updated'] + self.stats['skipped']
         print(f"  Success rate: {success}/{total} ({100*success/max(total,1):.1f}%)")
         print("=" * 50)
 
@@ -251,6 +381,8 @@ def main():
                         help='Upload a single .wiki file')
     parser.add_argument('--page-name',
                         help='Explicit wiki page name for --single-page upload')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Pages to upload in parallel (default: {DEFAULT_CONCURRENCY})')
 
     args = parser.parse_args()
 
@@ -264,7 +396,8 @@ def main():
         wiki_url=args.wiki_url,
         username=args.username,
         password=password,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        concurrency=args.concurrency
     )
 
     # Connect to wiki
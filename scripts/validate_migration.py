@@ -18,14 +18,25 @@ Usage:
 import os
 import re
 import csv
+import json
+import mmap
+import time
+import sqlite3
 import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 from urllib.parse import urljoin
 import yaml
 
+from postprocess import DOC_PREFIXES
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -34,17 +45,165 @@ except ImportError:
 
 SCRIPT_DIR = Path(__file__).parent
 BASE_DIR = SCRIPT_DIR.parent
+API_BATCH_SIZE = 50  # Max titles per API query for non-bot accounts
+
+# Results from earlier runs: page existence per wiki URL, and source word
+# counts keyed by path + mtime
+CACHE_DIR = Path.home() / '.cache' / 'df-wiki'
+CACHE_FILE = CACHE_DIR / 'page_exists.json'
+WORD_COUNT_CACHE = CACHE_DIR / 'word_counts.sqlite'
+DEFAULT_CACHE_TTL = 24 * 3600  # seconds
+PARALLEL_MIN_FILES = 200  # Below this, process startup costs more than it saves
+READ_WORKERS = 8  # Threads for smaller trees (overlap file reads)
+REPORT_BUFFER_SIZE = 1 << 20  # bytes
+REPORT_FIELDS = ['file', 'type', 'severity', 'description']
+MMAP_MIN_BYTES = 64 * 1024  # Larger wiki files are scanned in place, not read into a str
+
+# Patterns used per file, compiled once
+_RE_SH_OPEN = re.compile(r'<syntaxhighlight[^>]*>')
+_RE_WIKI_LINK = re.compile(r'\[\[([^\]|]+)')
+_RE_FILE_LINK = re.compile(r'\[\[File:([^\]|]+)')
+_RE_CODE_FENCE = re.compile(r'```[\s\S]*?```')
+_RE_INLINE_CODE = re.compile(r'`[^`]+`')
+_RE_WORD = re.compile(r'\w+')  # A maximal \w+ run is always \b-bounded, same as \b\w+\b
+_RE_WIKI_MARKUP_LINK = re.compile(r'\[\[[^\]]+\]\]')
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_TABLE_BLOCK = re.compile(r'\{\|[\s\S]*?\|\}')
+
+# Bytes equivalents for memory-mapped files; every pattern is ASCII, so
+# matches land on the same UTF-8 text as the str versions
+_RE_SH_OPEN_B = re.compile(rb'<syntaxhighlight[^>]*>')
+_RE_SH_CLOSE_B = re.compile(rb'</syntaxhighlight>')
+_RE_WIKI_LINK_B = re.compile(rb'\[\[([^\]|]+)')
+_RE_TABLE_OPEN_B = re.compile(rb'\{\|')
+_RE_TABLE_CLOSE_B = re.compile(rb'\|\}')
+_RE_LEADING_SPACE_B = re.compile(rb'\s*')
+
+INVENTORY_COLUMNS = ('source_path', 'source_type', 'title', 'status')
+
+
+class InventoryItem(NamedTuple):
+    source_path: str
+    source_type: str
+    title: str
+    status: str
 
 
 class MigrationValidator:
     """Validates documentation migration."""
 
-    def __init__(self, wiki_url: str = None, inventory_file: str = None):
+    def __init__(self, wiki_url: str = None, inventory_file: str = None,
+                 use_cache: bool = True, cache_ttl: float = DEFAULT_CACHE_TTL):
         self.wiki_url = wiki_url
         self.inventory_file = inventory_file
-        self.inventory = []
+        self.inventory: List[InventoryItem] = []
+        # Rows grouped by (source_type, status), built once at load
+        self._inventory_groups: Dict[Tuple[str, str], List[InventoryItem]] = {}
         self.issues = []
         self.wiki_pages: Set[str] = set()
+        self.missing_pages: Set[str] = set()
+        self._session = self._make_session() if REQUESTS_AVAILABLE else None
+
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self._checked_at: Dict[str, float] = {}
+        if self.use_cache and self.wiki_url:
+            self._load_cache()
+        self._word_db: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def _make_session():
+        """Keep-alive session with a small connection pool for wiki API calls."""
+        session = requests.Session()
+        # Back off on throttling/transient errors (honouring Retry-After)
+        # rather than treating the batch as unchecked
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=['GET', 'POST'], respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self):
+        """Save the caches and release pooled HTTP connections."""
+        if self.use_cache and self.wiki_url:
+            self._save_cache()
+        if self._word_db is not None:
+            self._word_db.close()
+            self._word_db = None
+        if self._session is not None:
+            self._session.close()
+
+    def _word_count_db(self) -> Optional[sqlite3.Connection]:
+        """Open (once) the word count cache; None when caching is off or unavailable."""
+        if self._word_db is None and self.use_cache:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(WORD_COUNT_CACHE)
+                db.execute('CREATE TABLE IF NOT EXISTS word_counts '
+                           '(source_path TEXT PRIMARY KEY, mtime_ns INTEGER, words INTEGER)')
+            except (OSError, sqlite3.Error):
+                self.use_cache = False
+                return None
+            self._word_db = db
+        return self._word_db
+
+    def cached_word_counts(self, mtimes: Dict[str, int]) -> Dict[str, int]:
+        """Cached word counts for the source paths whose mtime_ns still matches."""
+        db = self._word_count_db()
+        if db is None or not mtimes:
+            return {}
+        counts = {}
+        for source_path, mtime_ns, words in db.execute('SELECT source_path, mtime_ns, words FROM word_counts'):
+            if mtimes.get(source_path) == mtime_ns:
+                counts[source_path] = words
+        return counts
+
+    def store_word_counts(self, entries: Dict[str, Tuple[int, int]]):
+        """Upsert {source_path: (mtime_ns, words)} into the word count cache."""
+        db = self._word_count_db()
+        if db is None or not entries:
+            return
+        try:
+            with db:
+                db.executemany('INSERT OR REPLACE INTO word_counts VALUES (?, ?, ?)',
+                               [(path, mtime_ns, words) for path, (mtime_ns, words) in entries.items()])
+        except sqlite3.Error:
+            pass  # A stale cache only costs the next run a recount
+
+    def _load_cache(self):
+        """Seed wiki_pages with this wiki's unexpired cache entries.
+
+        Only pages found to exist are cached: a page uploaded right after a
+        run must not be reported missing until the entry expires. (Older
+        cache files may still hold misses; those are ignored.)
+        """
+        try:
+            cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for title, (exists, checked_at) in cache.get(self.wiki_url, {}).items():
+            if exists and now - checked_at < self.cache_ttl:
+                self.wiki_pages.add(title)
+                self._checked_at[title] = checked_at
+        if self._checked_at:
+            print(f"Loaded {len(self._checked_at)} cached page checks for {self.wiki_url}")
+
+    def _save_cache(self):
+        """Write this run's existing pages back, keeping other wikis' entries."""
+        now = time.time()
+        entries = {t: [True, self._checked_at.get(t, now)] for t in self.wiki_pages}
+        try:
+            cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            cache = {}
+        cache[self.wiki_url] = entries
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CACHE_FILE.write_text(json.dumps(cache), encoding='utf-8')
+        except OSError:
+            pass  # A missing cache only costs the next run its API calls
 
     def load_inventory(self) -> bool:
         """Load migration inventory CSV."""
@@ -52,14 +211,39 @@ class MigrationValidator:
             print(f"Warning: Inventory file not found: {self.inventory_file}")
             return False
 
+        # csv.reader with precomputed column indices (as in postprocess.py):
+        # no per-row dict, and only the columns the checks use are kept.
+        # Missing columns and short rows read as ''.
         with open(self.inventory_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            self.inventory = list(reader)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            width = len(header)
+            pick = itemgetter(*(header.index(name) if name in header else width
+                                for name in INVENTORY_COLUMNS))
+            inventory = []
+            groups = {}
+            # source_type and status take a handful of values: share one str
+            # per distinct value, like a categorical column
+            categories = {}
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) <= width:
+                    row += [''] * (width + 1 - len(row))
+                source_path, source_type, title, status = pick(row)
+                source_type = categories.setdefault(source_type, source_type)
+                status = categories.setdefault(status, status)
+                item = InventoryItem(source_path, source_type, title, status)
+                inventory.append(item)
+                groups.setdefault((source_type, status), []).append(item)
+        self.inventory = inventory
+        self._inventory_groups = groups
 
         print(f"Loaded {len(self.inventory)} items from inventory")
         return True
 
-    def get_source_word_count(self, source_path: str) -> int:
+    @staticmethod
+    def get_source_word_count(source_path: str) -> int:
         """Get word count from source file."""
         full_path = BASE_DIR / source_path
         if not full_path.exists():
@@ -67,74 +251,111 @@ class MigrationValidator:
 
         try:
             content = full_path.read_text(encoding='utf-8')
-            # Remove frontmatter
+            # Remove frontmatter (everything up to the closing ---)
             if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    content = parts[2]
+                end = content.find('---', 3)
+                if end != -1:
+                    content = content[end + 3:]
             # Remove code blocks
-            content = re.sub(r'```[\s\S]*?```', '', content)
-            content = re.sub(r'`[^`]+`', '', content)
+            content = _RE_CODE_FENCE.sub('', content)
+            content = _RE_INLINE_CODE.sub('', content)
             # Count words
-            words = re.findall(r'\b\w+\b', content)
-            return len(words)
+            return _count_words(content)
         except Exception:
             return 0
 
-    def check_wiki_page_exists(self, page_name: str) -> bool:
-        """Check if a wiki page exists (via API or cache)."""
-        if page_name in self.wiki_pages:
-            return True
+    def _bulk_check_pages(self, titles) -> None:
+        """Record which titles exist in wiki_pages / missing_pages, 50 per API query.
 
+        Titles are checked without their #fragment. A batch whose request
+        fails, or whose response has no query result (an API error such as
+        maxlag), is left unrecorded, so those titles are assumed to exist.
+        """
         if not REQUESTS_AVAILABLE or not self.wiki_url:
-            return True  # Assume exists if we can't check
+            return
 
-        try:
-            api_url = f"{self.wiki_url.rstrip('/')}/api.php"
+        pending = sorted({t.split('#', 1)[0] for t in titles}
+                         - self.wiki_pages - self.missing_pages)
+        api_url = f"{self.wiki_url.rstrip('/')}/api.php"
+        for i in range(0, len(pending), API_BATCH_SIZE):
+            batch = pending[i:i + API_BATCH_SIZE]
             params = {
                 'action': 'query',
-                'titles': page_name,
+                'titles': '|'.join(batch),
                 'format': 'json'
             }
-            response = requests.get(api_url, params=params, timeout=10)
-            data = response.json()
-
-            pages = data.get('query', {}).get('pages', {})
-            for page_id, page_data in pages.items():
-                if page_id != '-1' and 'missing' not in page_data:
-                    self.wiki_pages.add(page_name)
-                    return True
+            try:
+                response = self._session.get(api_url, params=params, timeout=10)
+                data = response.json()
+            except Exception:
+                continue
+            if 'query' not in data:
+                continue
+
+            query = data['query']
+            normalized = {n['from']: n['to'] for n in query.get('normalized', [])}
+            found = {
+                page_data.get('title')
+                for page_id, page_data in query.get('pages', {}).items()
+                if not page_id.startswith('-') and 'missing' not in page_data
+            }
+            for title in batch:
+                if normalized.get(title, title) in found:
+                    self.wiki_pages.add(title)
+                else:
+                    self.missing_pages.add(title)
 
+    def check_wiki_page_exists(self, page_name: str) -> bool:
+        """Check if a wiki page exists (cache lookup; queries the API on a miss)."""
+        title = page_name.split('#', 1)[0]
+        if title in self.wiki_pages:
+            return True
+        if title in self.missing_pages:
             return False
 
-        except Exception:
-            return True  # Assume exists on error
+        if not REQUESTS_AVAILABLE or not self.wiki_url:
+            return True  # Assume exists if we can't check
 
-    def extract_links_from_wiki(self, content: str) -> List[str]:
-        """Extract internal wiki links from content."""
-        links = []
+        self._bulk_check_pages([title])
+        return title not in self.missing_pages  # Assume exists on error
 
+    @staticmethod
+    def extract_links_from_wiki(content: str) -> List[str]:
+        """Extract internal wiki links from content."""
         # [[Page|text]] or [[Page]]
-        wiki_links = re.findall(r'\[\[([^\]|]+)', content)
-        for link in wiki_links:
-            # Skip category and file links
-            if not link.startswith(('Category:', 'File:', '#')):
-                links.append(link)
+        return MigrationValidator._filter_links(_RE_WIKI_LINK.findall(content))
 
-        return links
+    @staticmethod
+    def _filter_links(targets) -> List[str]:
+        """Drop category, file and same-page anchor links."""
+        return [link for link in targets
+                if not link.startswith(('Category:', 'File:', '#'))]
 
     def extract_images_from_wiki(self, content: str) -> List[str]:
         """Extract image references from wiki content."""
         images = []
 
         # [[File:name|...]]
-        file_links = re.findall(r'\[\[File:([^\]|]+)', content)
+        file_links = _RE_FILE_LINK.findall(content)
         images.extend(file_links)
 
         return images
 
     def validate_converted_file(self, wiki_file: str, source_file: str = None) -> List[Dict]:
         """Validate a single converted wiki file."""
+        issues, links = self.check_file_content(wiki_file, source_file)
+        issues.extend(self.check_links(wiki_file, links))
+        return issues
+
+    @staticmethod
+    def check_file_content(wiki_file: str, source_file: str = None,
+                           source_word_count: int = None) -> Tuple[List[Dict], List[str]]:
+        """Run the checks that need only the file itself.
+
+        Returns (issues, internal links); the links are left for check_links
+        so existence can be resolved in bulk by the caller. A known
+        source_word_count (e.g. from the cache) saves re-reading the source.
+        """
         issues = []
         wiki_path = Path(wiki_file)
 
@@ -145,12 +366,41 @@ class MigrationValidator:
                 'severity': 'Blocker',
                 'description': 'Converted wiki file not found'
             })
-            return issues
-
-        content = wiki_path.read_text(encoding='utf-8')
+            return issues, []
+
+        if source_file and source_word_count is None:
+            source_word_count = MigrationValidator.get_source_word_count(source_file)
+        need_words = bool(source_file) and source_word_count > 0
+
+        if wiki_path.stat().st_size > MMAP_MIN_BYTES:
+            # Large generated pages: count markup over the mapped bytes and
+            # decode only what the checks need, rather than a full str copy
+            with open(wiki_path, 'rb') as fh, \
+                    mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                too_short = _mapped_is_short(mm)
+                open_tags = _count_matches(_RE_SH_OPEN_B, mm)
+                close_tags = _count_matches(_RE_SH_CLOSE_B, mm)
+                escaped = mm.find(b'\\[') != -1 or mm.find(b'\\]') != -1
+                table_opens = _count_matches(_RE_TABLE_OPEN_B, mm)
+                table_closes = _count_matches(_RE_TABLE_CLOSE_B, mm) if table_opens else 0
+                has_category = mm.find(b'[[Category:') != -1
+                links = MigrationValidator._filter_links(
+                    m.group(1).decode('utf-8') for m in _RE_WIKI_LINK_B.finditer(mm))
+                wiki_words = _wiki_word_count(str(mm, 'utf-8')) if need_words else 0
+        else:
+            content = wiki_path.read_text(encoding='utf-8')
+            too_short = len(content.strip()) < 50
+            open_tags = len(_RE_SH_OPEN.findall(content))
+            close_tags = content.count('</syntaxhighlight>')
+            escaped = '\\[' in content or '\\]' in content
+            table_opens = content.count('{|')
+            table_closes = content.count('|}') if table_opens else 0
+            has_category = '[[Category:' in content
+            links = MigrationValidator.extract_links_from_wiki(content)
+            wiki_words = _wiki_word_count(content) if need_words else 0
 
         # Check for empty content
-        if len(content.strip()) < 50:
+        if too_short:
             issues.append({
                 'file': wiki_file,
                 'type': 'Empty Content',
@@ -160,8 +410,6 @@ class MigrationValidator:
 
         # Check for broken wiki syntax
         # Unclosed tags
-        open_tags = len(re.findall(r'<syntaxhighlight[^>]*>', content))
-        close_tags = len(re.findall(r'</syntaxhighlight>', content))
         if open_tags != close_tags:
             issues.append({
                 'file': wiki_file,
@@ -171,7 +419,7 @@ class MigrationValidator:
             })
 
         # Check for Pandoc artifacts
-        if '\\[' in content or '\\]' in content:
+        if escaped:
             issues.append({
                 'file': wiki_file,
                 'type': 'Formatting',
@@ -180,38 +428,27 @@ class MigrationValidator:
             })
 
         # Check for broken tables
-        if '{|' in content:
-            table_opens = content.count('{|')
-            table_closes = content.count('|}')
-            if table_opens != table_closes:
+        if table_opens != table_closes:
+            issues.append({
+                'file': wiki_file,
+                'type': 'Syntax Error',
+                'severity': 'Major',
+                'description': f'Mismatched table tags ({table_opens} open, {table_closes} close)'
+            })
+
+        # Check word count variance if source file provided
+        if need_words:
+            variance = abs(wiki_words - source_word_count) / max(source_word_count, 1)
+            if variance > 0.20:  # More than 20% variance
                 issues.append({
                     'file': wiki_file,
-                    'type': 'Syntax Error',
-                    'severity': 'Major',
-                    'description': f'Mismatched table tags ({table_opens} open, {table_closes} close)'
+                    'type': 'Content Variance',
+                    'severity': 'Minor',
+                    'description': f'Word count variance: source={source_word_count}, wiki={wiki_words} ({variance*100:.1f}%)'
                 })
 
-        # Check word count variance if source file provided
-        if source_file:
-            source_word_count = self.get_source_word_count(source_file)
-            if source_word_count > 0:
-                # Count words in wiki content (excluding markup)
-                wiki_text = re.sub(r'\[\[[^\]]+\]\]', '', content)  # Remove links
-                wiki_text = re.sub(r'<[^>]+>', '', wiki_text)  # Remove HTML
-                wiki_text = re.sub(r'\{\|[\s\S]*?\|\}', '', wiki_text)  # Remove tables
-                wiki_words = len(re.findall(r'\b\w+\b', wiki_text))
-
-                variance = abs(wiki_words - source_word_count) / max(source_word_count, 1)
-                if variance > 0.20:  # More than 20% variance
-                    issues.append({
-                        'file': wiki_file,
-                        'type': 'Content Variance',
-                        'severity': 'Minor',
-                        'description': f'Word count variance: source={source_word_count}, wiki={wiki_words} ({variance*100:.1f}%)'
-                    })
-
         # Check for missing categories
-        if '[[Category:' not in content:
+        if not has_category:
             issues.append({
                 'file': wiki_file,
                 'type': 'Missing Metadata',
@@ -219,9 +456,12 @@ class MigrationValidator:
                 'description': 'No categories assigned'
             })
 
-        # Check internal links
-        links = self.extract_links_from_wiki(content)
-        for link in links[:10]:  # Check first 10 links only
+        return issues, links
+
+    def check_links(self, wiki_file: str, links: List[str]) -> List[Dict]:
+        """Report internal links whose target page doesn't exist."""
+        issues = []
+        for link in links:
             if not self.check_wiki_page_exists(link):
                 issues.append({
                     'file': wiki_file,
@@ -229,11 +469,15 @@ class MigrationValidator:
                     'severity': 'Major',
                     'description': f'Internal link target not found: {link}'
                 })
-
         return issues
 
-    def validate_converted_directory(self, converted_dir: str) -> List[Dict]:
-        """Validate all files in converted directory."""
+    def validate_converted_directory(self, converted_dir: str,
+                                     report: 'ReportWriter' = None) -> List[Dict]:
+        """Validate all files in converted directory.
+
+        With a report, each file's issues are written to it as they are
+        assembled instead of being collected, and an empty list is returned.
+        """
         all_issues = []
         converted_path = Path(converted_dir)
 
@@ -244,79 +488,192 @@ class MigrationValidator:
         wiki_files = list(converted_path.rglob('*.wiki'))
         print(f"Validating {len(wiki_files)} converted files...")
 
-        for i, wiki_file in enumerate(wiki_files):
-            if i % 10 == 0:
-                print(f"  Progress: {i}/{len(wiki_files)}")
+        # Inventory rows by path relative to the docs root (the converted/
+        # layout), plus by bare filename for flattened trees; first row wins
+        inv_by_rel = {}
+        inv_by_name = {}
+        for item in self.inventory:
+            rel = item.source_path
+            for prefix in DOC_PREFIXES:
+                if rel.startswith(prefix):
+                    rel = rel[len(prefix):]
+                    break
+            rel = Path(rel)
+            inv_by_rel.setdefault(rel.as_posix(), item.source_path)
+            inv_by_name.setdefault(rel.name, item.source_path)
 
+        tasks = []
+        for wiki_file in wiki_files:
             # Find corresponding source file
             rel_path = wiki_file.relative_to(converted_path)
-            source_path = str(rel_path).replace('.wiki', '.md')
-
-            # Check inventory for source path
-            source_file = None
-            for item in self.inventory:
-                if source_path in item.get('source_path', ''):
-                    source_file = item.get('source_path')
-                    break
-
-            issues = self.validate_converted_file(str(wiki_file), source_file)
-            all_issues.extend(issues)
+            source_md = rel_path.with_suffix('.md')
+            source_file = inv_by_rel.get(source_md.as_posix())
+            if not source_file and len(rel_path.parts) == 1:
+                source_file = inv_by_name.get(source_md.name)
+
+            tasks.append((str(wiki_file), source_file))
+
+        # Reuse word counts for sources unchanged since an earlier run
+        mtimes = {}
+        for source_file in {source for _, source in tasks if source}:
+            try:
+                mtimes[source_file] = (BASE_DIR / source_file).stat().st_mtime_ns
+            except OSError:
+                pass  # Missing source: counted as 0, nothing to cache
+        known = self.cached_word_counts(mtimes)
+        tasks = [(wiki_file, source, known.get(source)) for wiki_file, source in tasks]
+
+        # The per-file checks are CPU-bound regex work, so large trees are
+        # spread over worker processes. Smaller trees use a few threads, which
+        # still overlaps the wiki/source file reads with the regex work.
+        # Link existence stays in this process.
+        if len(tasks) >= PARALLEL_MIN_FILES:
+            executor, chunksize = ProcessPoolExecutor(), 16
+        else:
+            executor, chunksize = ThreadPoolExecutor(max_workers=READ_WORKERS), 1
+        results = []
+        with executor:
+            for i, result in enumerate(executor.map(_check_file_task, tasks, chunksize=chunksize)):
+                if i % 10 == 0:
+                    print(f"  Progress: {i}/{len(tasks)}")
+                results.append(result)
+
+        # Check every linked page at once, 50 titles per request
+        if REQUESTS_AVAILABLE and self.wiki_url:
+            titles = {link for _, links, _ in results for link in links}
+            print(f"Checking {len(titles)} linked pages on the wiki...")
+            self._bulk_check_pages(titles)
+
+        for (wiki_file, _, _), (issues, links, _) in zip(tasks, results):
+            issues.extend(self.check_links(wiki_file, links))
+            if report is not None:
+                report.write(issues)
+            else:
+                all_issues.extend(issues)
+
+        self.store_word_counts({
+            source: (mtimes[source], words)
+            for (_, source, cached), (_, _, words) in zip(tasks, results)
+            if cached is None and source in mtimes
+        })
 
         return all_issues
 
+    def inventory_rows(self, source_type: str, status: str) -> List[InventoryItem]:
+        """Inventory rows with the given source_type and status, in file order."""
+        return self._inventory_groups.get((source_type, status), [])
+
     def validate_inventory_completeness(self) -> List[Dict]:
         """Check that all inventory items have been migrated."""
-        issues = []
-
-        for item in self.inventory:
-            if item.get('source_type') != 'df-docs':
-                continue  # Focus on primary source
-
-            source_path = item.get('source_path', '')
-            status = item.get('status', 'Not Started')
-
-            if status == 'Not Started':
-                issues.append({
-                    'file': source_path,
-                    'type': 'Not Migrated',
-                    'severity': 'Major',
-                    'description': f"Source file not migrated: {item.get('title', 'Unknown')}"
-                })
-
-        return issues
+        # Focus on primary source
+        return [
+            {
+                'file': item.source_path,
+                'type': 'Not Migrated',
+                'severity': 'Major',
+                'description': f"Source file not migrated: {item.title or 'Unknown'}"
+            }
+            for item in self.inventory_rows('df-docs', 'Not Started')
+        ]
 
     def generate_report(self, issues: List[Dict], output_file: str):
         """Generate validation report CSV."""
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['file', 'type', 'severity', 'description'])
-            writer.writeheader()
-            writer.writerows(issues)
-
-        print(f"\nValidation report written to: {output_file}")
-
-        # Print summary
-        severity_counts = {}
-        type_counts = {}
+        with ReportWriter(output_file) as report:
+            report.write(issues)
+        report.print_summary()
+
+
+class ReportWriter:
+    """Validation report CSV, written incrementally as issues arrive.
+
+    Only running counts are kept for the summary, not the issues themselves.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.total = 0
+        self.severity_counts = Counter()
+        self.type_counts = Counter()
+        self._file = None
+        self._writer = None
+
+    def __enter__(self) -> 'ReportWriter':
+        self._file = open(self.output_file, 'w', newline='', encoding='utf-8',
+                          buffering=REPORT_BUFFER_SIZE)
+        self._writer = csv.DictWriter(self._file, fieldnames=REPORT_FIELDS)
+        self._writer.writeheader()
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+        return False
+
+    def write(self, issues: List[Dict]):
+        """Append a batch of issues to the report."""
+        self._writer.writerows(issues)
+        self.total += len(issues)
         for issue in issues:
-            sev = issue.get('severity', 'Unknown')
-            typ = issue.get('type', 'Unknown')
-            severity_counts[sev] = severity_counts.get(sev, 0) + 1
-            type_counts[typ] = type_counts.get(typ, 0) + 1
+            self.severity_counts[issue.get('severity', 'Unknown')] += 1
+            self.type_counts[issue.get('type', 'Unknown')] += 1
+
+    def print_summary(self):
+        """Print where the report went and the issue counts."""
+        print(f"\nValidation report written to: {self.output_file}")
 
         print("\n" + "=" * 50)
         print("Validation Summary")
         print("=" * 50)
-        print(f"Total issues: {len(issues)}")
+        print(f"Total issues: {self.total}")
         print("\nBy severity:")
         for sev in ['Blocker', 'Major', 'Minor']:
-            count = severity_counts.get(sev, 0)
-            print(f"  {sev}: {count}")
+            print(f"  {sev}: {self.severity_counts[sev]}")
         print("\nBy type:")
-        for typ, count in sorted(type_counts.items(), key=lambda x: -x[1]):
+        for typ, count in sorted(self.type_counts.items(), key=lambda x: -x[1]):
             print(f"  {typ}: {count}")
         print("=" * 50)
 
 
+def _count_words(text: str) -> int:
+    """Count words without building a list of every match."""
+    return sum(1 for _ in _RE_WORD.finditer(text))
+
+
+def _wiki_word_count(content: str) -> int:
+    """Count words in wiki content, excluding links, HTML and tables."""
+    wiki_text = _RE_WIKI_MARKUP_LINK.sub('', content)  # Remove links
+    wiki_text = _RE_HTML_TAG.sub('', wiki_text)  # Remove HTML
+    wiki_text = _RE_TABLE_BLOCK.sub('', wiki_text)  # Remove tables
+    return _count_words(wiki_text)
+
+
+def _count_matches(pattern: re.Pattern, data) -> int:
+    """Count non-overlapping matches (str.count for a mapped buffer)."""
+    return sum(1 for _ in pattern.finditer(data))
+
+
+def _mapped_is_short(mm: mmap.mmap) -> bool:
+    """len(text.strip()) < 50 for a mapped file, without decoding all of it."""
+    start = _RE_LEADING_SPACE_B.match(mm).end()
+    end = len(mm)
+    while end > start and mm[end - 1] in b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f':
+        end -= 1
+    if end - start >= 50 * 4:  # Even all 4-byte characters would be 50+
+        return False
+    return len(str(mm[start:end], 'utf-8').strip()) < 50
+
+
+def _check_file_task(task: Tuple[str, Optional[str], Optional[int]]) -> Tuple[List[Dict], List[str], Optional[int]]:
+    """Picklable entry point for check_file_content in worker processes.
+
+    Returns (issues, links, source word count) so the parent can cache the count.
+    """
+    wiki_file, source_file, source_words = task
+    if source_file and source_words is None:
+        source_words = MigrationValidator.get_source_word_count(source_file)
+    issues, links = MigrationValidator.check_file_content(wiki_file, source_file, source_words)
+    return issues, links, source_words
+
+
 def main():
     parser = argparse.ArgumentParser(description='Validate documentation migration')
     parser.add_argument('--wiki-url', '-w',
@@ -329,32 +686,39 @@ def main():
                         help='Output report CSV')
     parser.add_argument('--check-links', '-l', action='store_true',
                         help='Check wiki links (requires internet)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Ignore and do not update the page existence and word count caches in {CACHE_DIR}')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_CACHE_TTL,
+                        help='Seconds before a cached page check is re-queried (default: 86400)')
 
     args = parser.parse_args()
 
     validator = MigrationValidator(
         wiki_url=args.wiki_url if args.check_links else None,
-        inventory_file=SCRIPT_DIR / args.inventory
+        inventory_file=SCRIPT_DIR / args.inventory,
+        use_cache=not args.no_cache,
+        cache_ttl=args.cache_ttl
     )
 
     # Load inventory
     validator.load_inventory()
 
-    all_issues = []
+    # Issues go straight to the report CSV as each file is checked
+    with ReportWriter(str(SCRIPT_DIR / args.output)) as report:
+        # Validate converted files
+        converted_path = SCRIPT_DIR / args.converted_dir
+        if converted_path.exists():
+            validator.validate_converted_directory(str(converted_path), report=report)
+        else:
+            print(f"Note: Converted directory not found: {converted_path}")
+            print("  Run batch_convert.sh first to create converted files")
 
-    # Validate converted files
-    converted_path = SCRIPT_DIR / args.converted_dir
-    if converted_path.exists():
-        all_issues.extend(validator.validate_converted_directory(str(converted_path)))
-    else:
-        print(f"Note: Converted directory not found: {converted_path}")
-        print("  Run batch_convert.sh first to create converted files")
+        # Check inventory completeness
+        report.write(validator.validate_inventory_completeness())
 
-    # Check inventory completeness
-    all_issues.extend(validator.validate_inventory_completeness())
+    validator.close()
 
-    # Generate report
-    validator.generate_report(all_issues, str(SCRIPT_DIR / args.output))
+    report.print_summary()
 
 
 if __name__ == '__main__':
@@ -2,7 +2,7 @@
 """
 verify_old_wiki_redirects.py - Verify old wiki URL redirects on the wiki
 
-Queries the MediaWiki API to verify:
+Queries the MediaWiki API (in batches of 50 titles) to verify:
 - Every redirect page exists
 - Redirect targets exist and return content
 - Hub pages have valid internal links
@@ -11,13 +11,20 @@ Queries the MediaWiki API to verify:
 Usage:
     python verify_old_wiki_redirects.py --wiki-url http://localhost:8082
     python verify_old_wiki_redirects.py --wiki-url https://wiki.dreamfactory.com
+    python verify_old_wiki_redirects.py --wiki-url http://localhost:8082 --results-file results.jsonl
 """
 
 import json
 import re
 import argparse
+import sqlite3
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 try:
     import mwclient
@@ -25,13 +32,64 @@ except ImportError:
     print("Error: mwclient not installed. Run: pip install mwclient")
     sys.exit(1)
 
+# requests and urllib3 are installed with mwclient
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 
 SCRIPT_DIR = Path(__file__).parent
 DEFAULT_MAP_FILE = SCRIPT_DIR / 'old_wiki_redirect_map.json'
-
-
-def connect_wiki(wiki_url: str, username: str = None, password: str = None):
-    """Connect to the MediaWiki site."""
+CACHE_DIR = Path.home() / '.cache' / 'df-wiki'
+PAGE_CACHE = CACHE_DIR / 'verify.sqlite'
+API_BATCH_SIZE = 50  # Max titles per API query for non-bot accounts
+FETCH_WORKERS = 4  # Default concurrent batch queries; small to stay polite to the wiki
+MAX_LAG = 5  # seconds of replication lag the wiki may report before asking us to back off
+MAX_LAG_RETRIES = 5  # per query; mwclient's default of 25 can stall a worker for minutes
+QUERY_RATE = 10  # max batch queries per second across all workers
+
+_RE_WIKI_LINK = re.compile(r'\[\[([^|\]]+)(?:\|[^\]]+)?\]\]')
+# Links to these namespaces are not content pages a hub/stub needs to resolve
+_SKIP_PREFIXES = ('Category:', 'File:', 'Image:', 'Media:', ':Category:', ':File:')
+# Title forms: spaces (the API's form, used as cache keys) and underscores (URLs and the map)
+_TITLE_KEY = str.maketrans('_', ' ')
+_TITLE_URL = str.maketrans(' ', '_')
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads (a token bucket of one)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_query_limiter = RateLimiter(QUERY_RATE)
+
+
+def mount_pool(session: requests.Session, pool_size: int = FETCH_WORKERS) -> None:
+    """Pool mwclient's keep-alive session for the concurrent batch queries."""
+    # Queries are read-only, so POSTs are safe to retry too
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                  allowed_methods=['GET', 'POST'], respect_retry_after_header=True)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(pool_size, 10),
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def connect_wiki(wiki_url: str, username: str = None, password: str = None,
+                 pool_size: int = FETCH_WORKERS):
+    """Connect to the MediaWiki site (pool_size: connections kept for concurrent queries)."""
     url = wiki_url.replace('https://', '').replace('http://', '')
     host = url.split('/')[0]
     path = '/' + '/'.join(url.split('/')[1:]) if '/' in url else '/'
@@ -39,7 +97,13 @@ def connect_wiki(wiki_url: str, username: str = None, password: str = None):
         path += '/'
 
     scheme = 'https' if wiki_url.startswith('https://') else 'http'
-    site = mwclient.Site(host, path=path, scheme=scheme)
+    # mwclient sends maxlag with every call and, when the wiki is lagged,
+    # sleeps and retries only that call; 429s are retried by the session.
+    # mwclient sets its User-Agent only on a session it creates itself, so
+    # the pool is mounted on that session rather than passed in
+    site = mwclient.Site(host, path=path, scheme=scheme,
+                         max_lag=MAX_LAG, max_retries=MAX_LAG_RETRIES)
+    mount_pool(site.connection, pool_size)
 
     if username and password:
         site.login(username, password)
@@ -49,21 +113,264 @@ def connect_wiki(wiki_url: str, username: str = None, password: str = None):
     return site
 
 
-def extract_redirect_target(text: str):
-    """Extract redirect target from wiki markup."""
-    match = re.match(r'#REDIRECT\s*\[\[([^\]]+)\]\]', text, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    return None
+class ResolvedPage(NamedTuple):
+    """A title as the API resolved it."""
+    redirect_to: Optional[str]  # First-hop target ("Title" or "Title#Fragment"), if a redirect
+    text: Optional[str]  # Wikitext of the final page; None if it doesn't exist
+    length: Optional[int] = None  # Final page's size in bytes (prop=info), if it exists
+
+
+class PageCache:
+    """What one run has learned about a wiki's pages.
+
+    exists records whether a page exists, by _title_key (filled by
+    check_existence_bulk). With persistent set, wikitext is also kept in
+    PAGE_CACHE across runs by title as (lastrevid, text): saved is what
+    earlier runs stored, and pages downloaded by this run's workers are
+    collected (under a lock) until save().
+    """
+
+    def __init__(self, wiki_url: str, persistent: bool = True):
+        self.wiki_url = wiki_url
+        self.persistent = persistent
+        self.exists: Dict[str, bool] = {}
+        self.saved: Dict[str, Tuple[int, str]] = {}
+        self._fetched: Dict[str, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Load this wiki's cached wikitext from PAGE_CACHE."""
+        if not self.persistent:
+            return
+        try:
+            with sqlite3.connect(PAGE_CACHE) as db:
+                rows = db.execute('SELECT title, lastrev, text FROM pages WHERE wiki = ?',
+                                  (self.wiki_url,))
+                self.saved.update((title, (lastrev, text)) for title, lastrev, text in rows)
+        except sqlite3.Error:
+            return  # No cache yet (or unreadable): this run fetches everything
+        if self.saved:
+            print(f'Loaded {len(self.saved)} cached pages for {self.wiki_url}')
+
+    def text(self, title: str, lastrevid: Optional[int]) -> Optional[str]:
+        """The cached wikitext of title if it is still at lastrevid, else None."""
+        cached = self.saved.get(title)
+        if cached and cached[0] == lastrevid:
+            return cached[1]
+        return None
+
+    def store(self, title: str, lastrevid: int, text: str):
+        """Record a page downloaded this run (called from worker threads)."""
+        if self.persistent:
+            with self._lock:
+                self._fetched[title] = (lastrevid, text)
+
+    def save(self):
+        """Upsert the pages downloaded this run into PAGE_CACHE."""
+        if not self.persistent or not self._fetched:
+            return
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(PAGE_CACHE) as db:
+                db.execute('CREATE TABLE IF NOT EXISTS pages (wiki TEXT, title TEXT, '
+                           'lastrev INTEGER, text TEXT, PRIMARY KEY (wiki, title))')
+                db.executemany('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)',
+                               [(self.wiki_url, title, *cached)
+                                for title, cached in self._fetched.items()])
+        except (OSError, sqlite3.Error):
+            pass  # A missing cache only costs the next run the page downloads
+
+
+def _query(site, params: dict):
+    """Run one query to completion, following any continuations.
+
+    Returns the normalized and redirects maps and the existing pages by title.
+    """
+    params = dict(params)
+    normalized = {}
+    redirects = {}
+    pages = {}
+    while True:
+        # site.api() POSTs by default, so 50 long titles never hit URL length limits
+        _query_limiter.wait()
+        data = site.api('query', **params)
+        query = data.get('query', {})
+        normalized.update((n['from'], n['to']) for n in query.get('normalized', []))
+        redirects.update((r['from'], (r['to'], r.get('tofragment'))) for r in query.get('redirects', []))
+        for page in query.get('pages', {}).values():
+            if 'missing' in page or 'invalid' in page:
+                continue
+            # A page's revisions can arrive in a later continuation than its info
+            pages.setdefault(page['title'], {}).update(page)
+        if 'continue' not in data:
+            break
+        params.update(data['continue'])
+    return normalized, redirects, pages
+
+
+def _page_text(page: dict) -> str:
+    """The wikitext in a query result page ('' when no revisions were asked for)."""
+    revisions = page.get('revisions')
+    if not revisions:
+        return ''
+    rev = revisions[0]
+    return rev.get('slots', {}).get('main', rev).get('*', '')
+
+
+def _fetch_batch(site, batch: List[str], cache: Optional[PageCache] = None,
+                 follow_redirects: bool = False, content: bool = True) -> Dict[str, ResolvedPage]:
+    """Fetch up to 50 titles in one query (following any continuations).
+
+    With follow_redirects the API resolves redirects in the same request
+    (redirects=1), so a redirect's entry carries its target's content.
+    Without content only prop=info is asked for, and existing pages get ''.
+
+    When cache holds wikitext saved by earlier runs, a prop=info query comes
+    first and only pages whose lastrevid changed are downloaded again.
+    """
+    params = {'titles': '|'.join(batch)}
+    if follow_redirects:
+        params['redirects'] = 1
+    content_params = {'prop': 'info|revisions', 'rvprop': 'content', 'rvslots': 'main'}
+    texts = {}
+    lengths = {}
+    if not content:
+        normalized, redirects, found = _query(site, dict(params, prop='info'))
+    elif cache is not None and cache.saved:
+        normalized, redirects, found = _query(site, dict(params, prop='info'))
+        stale = []
+        for title, page in found.items():
+            cached = cache.text(title, page.get('lastrevid'))
+            if cached is not None:
+                texts[title] = cached
+            else:
+                stale.append(title)
+        if stale:
+            found.update(_query(site, dict(content_params, titles='|'.join(stale)))[2])
+    else:
+        normalized, redirects, found = _query(site, dict(params, **content_params))
+    for title, page in found.items():
+        lengths[title] = page.get('length')
+        if title in texts:
+            continue
+        texts[title] = _page_text(page)
+        if content and cache is not None and 'lastrevid' in page:
+            cache.store(title, page['lastrevid'], texts[title])
+
+    pages = {}
+    for title in batch:
+        name = normalized.get(title, title)
+        redirect_to = None
+        if name in redirects:
+            name, fragment = redirects[name]
+            redirect_to = f'{name}#{fragment}' if fragment else name
+            # Double redirects: the content is the last page's
+            seen = {name}
+            while name in redirects and redirects[name][0] not in seen:
+                name = redirects[name][0]
+                seen.add(name)
+        pages[title] = ResolvedPage(redirect_to, texts.get(name), lengths.get(name))
+    return pages
+
+
+def _fetch_all(site, titles: List[str], workers: int = FETCH_WORKERS,
+               cache: Optional[PageCache] = None, **kwargs) -> Dict[str, ResolvedPage]:
+    """Run _fetch_batch over titles, 50 per query, up to workers at a time."""
+    batches = [titles[i:i + API_BATCH_SIZE] for i in range(0, len(titles), API_BATCH_SIZE)]
+    pages = {}
+    if len(batches) <= 1 or workers <= 1:
+        for batch in batches:
+            pages.update(_fetch_batch(site, batch, cache, **kwargs))
+        return pages
+    # Each query is a blocking round-trip; mwclient's session is shared by the threads
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch_pages in executor.map(lambda batch: _fetch_batch(site, batch, cache, **kwargs),
+                                        batches):
+            pages.update(batch_pages)
+    return pages
+
+
+def _title_key(title: str) -> str:
+    """Cache key for a title: underscores and spaces are the same to MediaWiki."""
+    return title.translate(_TITLE_KEY).strip()
+
+
+def _same_title(a: str, b: str) -> bool:
+    """Whether two titles name the same page (first letter is case-insensitive)."""
+    a, b = _title_key(a), _title_key(b)
+    return a[:1].upper() + a[1:] == b[:1].upper() + b[1:]
+
+
+def check_existence_bulk(site, titles: Iterable[str], workers: int = FETCH_WORKERS,
+                         cache: Optional[PageCache] = None) -> Set[str]:
+    """Return the subset of titles that don't exist on the wiki.
+
+    One POSTed prop=info query per 50 titles (no content), with up to
+    workers batches in flight; the API's normalized titles are mapped
+    back. With a cache, each distinct title is only checked once (see
+    PageCache.exists).
+    """
+    exists = cache.exists if cache is not None else {}
+    titles = list(dict.fromkeys(titles))
+    wanted = list(dict.fromkeys(
+        key for key in map(_title_key, titles) if key not in exists))
+    exists.update(
+        (key, page.text is not None)
+        for key, page in _fetch_all(site, wanted, workers, content=False).items()
+    )
+    return {title for title in titles if not exists[_title_key(title)]}
+
+
+def resolve_redirects_bulk(site, titles: Iterable[str], workers: int = FETCH_WORKERS,
+                           content: bool = True,
+                           cache: Optional[PageCache] = None) -> Dict[str, ResolvedPage]:
+    """Resolve each title's redirect and fetch the target in the same query.
+
+    For a redirect the result has its target and the target's wikitext; for
+    any other page, no target and the page's own wikitext. Without content
+    only the final page's length is fetched (its text is '').
+    """
+    return _fetch_all(site, list(dict.fromkeys(titles)), workers, cache,
+                      follow_redirects=True, content=content)
 
 
 def extract_wiki_links(text: str):
-    """Extract all internal wiki links from markup."""
-    return re.findall(r'\[\[([^|\]]+)(?:\|[^\]]+)?\]\]', text)
+    """Extract the distinct internal wiki links from markup, in order."""
+    return list(dict.fromkeys(_RE_WIKI_LINK.findall(text)))
+
+
+def _link_title(link: str) -> str:
+    """The page a link points at, without any #anchor ('' for same-page anchors)."""
+    return link.split('#', 1)[0].strip()
+
+
+def content_links(links: List[str]) -> List[str]:
+    """Links that point at content pages (no categories, files or same-page anchors)."""
+    return [link for link in links if not link.startswith(_SKIP_PREFIXES) and _link_title(link)]
 
 
-def verify_entry(site, entry: dict) -> dict:
-    """Verify a single redirect map entry. Returns a result dict."""
+def scan_links(entries: List[dict], resolved: Dict[str, ResolvedPage]) -> Dict[str, List[str]]:
+    """Extract each existing hub/stub page's links once, keyed by old_path."""
+    return {
+        entry['old_path']: extract_wiki_links(resolved[entry['old_path']].text or '')
+        for entry in entries
+        if entry['strategy'] in ('hub', 'stub') and entry['old_path'] in resolved
+    }
+
+
+def linked_titles(links: List[str]) -> List[str]:
+    """Titles verify_entry will look up for a hub/stub page with these links."""
+    return [_link_title(link) for link in content_links(links)]
+
+
+def verify_entry(resolved: Dict[str, ResolvedPage], missing: Set[str], entry: dict,
+                 page_links: Dict[str, List[str]]) -> dict:
+    """Verify a single redirect map entry against prefetched pages.
+
+    resolved holds the entry's old_path from resolve_redirects_bulk,
+    page_links its links from scan_links, and missing the result of
+    check_existence_bulk over their linked_titles. Returns a result dict.
+    """
     strategy = entry['strategy']
     old_path = entry['old_path']
     rank = entry['rank']
@@ -83,43 +390,40 @@ def verify_entry(site, entry: dict) -> dict:
         return result
 
     # Check that the redirect/hub/stub page exists at the old path
-    page = site.pages[old_path]
-    if not page.exists:
+    page = resolved[old_path]
+    if page.redirect_to is None and page.text is None:
         result['status'] = 'FAIL'
         result['details'] = f'Page "{old_path}" does not exist on wiki'
         return result
-
-    page_text = page.text()
+    page_text = page.text or ''
 
     if strategy in ('redirect', 'redirect-closest'):
         expected_target = entry['new_target']
 
         # Check it's actually a redirect
-        actual_target = extract_redirect_target(page_text)
-        if not actual_target:
+        if page.redirect_to is None:
             result['status'] = 'FAIL'
             result['details'] = f'Page exists but is not a redirect'
             return result
 
-        # Normalize for comparison (MediaWiki is case-insensitive for first char)
-        if actual_target.replace(' ', '_') != expected_target.replace(' ', '_'):
+        # The API gives the target normalized (spaces, first letter uppercase)
+        actual_target = page.redirect_to.translate(_TITLE_URL)
+        if not _same_title(actual_target, expected_target):
             result['status'] = 'WARN'
             result['details'] = f'Redirect target mismatch: expected "{expected_target}", got "{actual_target}"'
             # Still check if the actual target exists
             expected_target = actual_target
 
-        # Verify target page exists
-        target_page = site.pages[expected_target]
-        if not target_page.exists:
+        # Verify target page exists (its info came with the redirect)
+        if page.text is None:
             result['status'] = 'FAIL'
             result['details'] = f'Redirect target "{expected_target}" does not exist'
             return result
 
-        # Verify target has content (not empty)
-        target_text = target_page.text()
-        if not target_text or len(target_text.strip()) < 10:
+        # Verify target has content (not empty); the size is enough, no text needed
+        if page.length is not None and page.length < 10:
             result['status'] = 'WARN'
-            result['details'] = f'Redirect target "{expected_target}" exists but has minimal content ({len(target_text)} chars)'
+            result['details'] = f'Redirect target "{expected_target}" exists but has minimal content ({page.length} bytes)'
             return result
 
         if result['status'] == 'PASS':
@@ -127,21 +431,14 @@ def verify_entry(site, entry: dict) -> dict:
 
     elif strategy == 'hub':
         # Verify hub page has links
-        links = extract_wiki_links(page_text)
+        links = page_links[old_path]
         if not links:
             result['status'] = 'WARN'
             result['details'] = 'Hub page has no internal links'
             return result
 
         # Verify linked pages exist
-        missing_targets = []
-        for link_target in links:
-            # Skip category links
-            if link_target.startswith('Category:'):
-                continue
-            target_page = site.pages[link_target]
-            if not target_page.exists:
-                missing_targets.append(link_target)
+        missing_targets = [l for l in content_links(links) if _link_title(l) in missing]
 
         if missing_targets:
             result['status'] = 'WARN'
@@ -159,11 +456,11 @@ def verify_entry(site, entry: dict) -> dict:
             return result
 
         # Check if stub links resolve
-        links = extract_wiki_links(page_text)
-        missing = [l for l in links if not l.startswith('Category:') and not site.pages[l].exists]
-        if missing:
+        links = page_links[old_path]
+        missing_targets = [l for l in content_links(links) if _link_title(l) in missing]
+        if missing_targets:
             result['status'] = 'WARN'
-            result['details'] = f'Stub has {len(missing)} missing link targets: {", ".join(missing[:3])}'
+            result['details'] = f'Stub has {len(missing_targets)} missing link targets: {", ".join(missing_targets[:3])}'
         else:
             result['details'] = f'Stub with {len(links)} links (OK)'
 
@@ -180,6 +477,12 @@ def main():
                         help='Path to redirect map JSON')
     parser.add_argument('--username', '-u', help='Wiki username')
     parser.add_argument('--password', '-p', help='Wiki password')
+    parser.add_argument('--workers', type=int, default=FETCH_WORKERS,
+                        help=f'Batch queries to run in parallel (default: {FETCH_WORKERS}; 1 = sequential)')
+    parser.add_argument('--results-file', type=Path,
+                        help='Also write one JSON result per line (JSONL) to this file as entries are verified')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Download all page content instead of reusing unchanged pages from {PAGE_CACHE}')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Show details for all entries, not just failures')
     args = parser.parse_args()
@@ -194,54 +497,105 @@ def main():
     # Connect to wiki
     print(f'Connecting to {args.wiki_url}...')
     try:
-        site = connect_wiki(args.wiki_url, args.username, args.password)
+        site = connect_wiki(args.wiki_url, args.username, args.password, args.workers)
     except Exception as e:
         print(f'Error connecting: {e}')
         return 1
     print('Connected.\n')
-
-    # Verify each entry
-    results = []
-    for entry in entries:
-        result = verify_entry(site, entry)
-        results.append(result)
-
-        # Print progress
-        icon = {'PASS': 'OK', 'FAIL': 'FAIL', 'WARN': 'WARN'}[result['status']]
-        if result['status'] != 'PASS' or args.verbose:
-            print(f'  [{icon}] Rank {result["rank"]}: {result["old_path"]} - {result["details"]}')
-        elif result['strategy'] != 'no-action':
-            print(f'  [{icon}] Rank {result["rank"]}: {result["old_path"]}')
+    cache = PageCache(args.wiki_url, persistent=not args.no_cache)
+    cache.load()
+
+    # Fetch every page the checks need up front, 50 titles per query: the
+    # old paths (the API resolves redirects in the same request), then the
+    # pages hubs and stubs link to. Redirect checks only need their target's
+    # length, so only hub and stub pages have their content downloaded
+    actionable = [entry for entry in entries if entry['strategy'] != 'no-action']
+    resolved = resolve_redirects_bulk(
+        site, (entry['old_path'] for entry in actionable if entry['strategy'] not in ('hub', 'stub')),
+        args.workers, content=False, cache=cache)
+    resolved.update(resolve_redirects_bulk(
+        site, (entry['old_path'] for entry in actionable if entry['strategy'] in ('hub', 'stub')),
+        args.workers, cache=cache))
+    # Each hub/stub page's text is scanned for links once, for both the
+    # prefetch and the checks
+    page_links = scan_links(actionable, resolved)
+    missing = check_existence_bulk(
+        site, (title for links in page_links.values() for title in linked_titles(links)),
+        args.workers, cache)
+    cache.save()
+
+    # Verify each entry; results are streamed to --results-file as they
+    # come, and only the counts and failures are kept for the summary
+    status_counts = Counter()
+    no_actions = len(entries) - len(actionable)
+    failures = []
+    # Entries that repeat an old path (with the same strategy and target)
+    # reuse the first one's outcome instead of being checked again; only the
+    # (status, details) pair is kept, not the whole result
+    verified: Dict[tuple, Tuple[str, str]] = {}
+    results_file = open(args.results_file, 'w', encoding='utf-8') if args.results_file else None
+    try:
+        for entry in entries:
+            key = (entry['old_path'], entry['strategy'], entry.get('new_target'))
+            outcome = verified.get(key)
+            if outcome is None:
+                result = verify_entry(resolved, missing, entry, page_links)
+                verified[key] = (result['status'], result['details'])
+            else:
+                result = {
+                    'rank': entry['rank'],
+                    'old_path': entry['old_path'],
+                    'views': entry['views'],
+                    'strategy': entry['strategy'],
+                    'status': outcome[0],
+                    'details': outcome[1],
+                }
+            if results_file:
+                results_file.write(json.dumps(result) + '\n')
+
+            status = result['status']
+            status_counts[status] += 1
+            if status == 'FAIL':
+                failures.append(result)
+
+            # Print progress
+            icon = {'PASS': 'OK', 'FAIL': 'FAIL', 'WARN': 'WARN'}[status]
+            if status != 'PASS' or args.verbose:
+                print(f'  [{icon}] Rank {result["rank"]}: {result["old_path"]} - {result["details"]}')
+            elif result['strategy'] != 'no-action':
+                print(f'  [{icon}] Rank {result["rank"]}: {result["old_path"]}')
+    finally:
+        if results_file:
+            results_file.close()
 
     # Summary
-    passes = sum(1 for r in results if r['status'] == 'PASS')
-    fails = sum(1 for r in results if r['status'] == 'FAIL')
-    warns = sum(1 for r in results if r['status'] == 'WARN')
-    no_actions = sum(1 for r in results if r['strategy'] == 'no-action')
-    actionable = len(results) - no_actions
+    total = len(entries)
+    passes, warns, fails = status_counts['PASS'], status_counts['WARN'], status_counts['FAIL']
+    checked = total - no_actions
 
     print(f'\n{"=" * 60}')
     print('Verification Summary')
     print(f'{"=" * 60}')
-    print(f'  Total entries:    {len(results)}')
+    print(f'  Total entries:    {total}')
     print(f'  No-action:        {no_actions}')
-    print(f'  Actionable:       {actionable}')
+    print(f'  Actionable:       {checked}')
     print(f'  PASS:             {passes}')
     print(f'  WARN:             {warns}')
     print(f'  FAIL:             {fails}')
+    if args.results_file:
+        print(f'  Results written to {args.results_file}')
 
     if fails > 0:
-        pct = (actionable - fails) / max(actionable, 1) * 100
-        print(f'\n  Pass rate: {pct:.1f}% ({actionable - fails}/{actionable})')
+        pct = (checked - fails) / max(checked, 1) * 100
+        print(f'\n  Pass rate: {pct:.1f}% ({checked - fails}/{checked})')
         print(f'\n  FAILURES:')
-        for r in results:
-            if r['status'] == 'FAIL':
-                print(f'    Rank {r["rank"]} ({r["views"]} views): {r["old_path"]}')
-                print(f'      {r["details"]}')
+        for r in failures:
+            print(f'    Rank {r["rank"]} ({r["views"]} views): {r["old_path"]}')
+            print(f'      {r["details"]}')
         print(f'{"=" * 60}')
         return 1
     else:
-        print(f'\n  Pass rate: 100% ({actionable}/{actionable})')
+        print(f'\n  Pass rate: 100% ({checked}/{checked})')
         print(f'{"=" * 60}')
         return 0
 